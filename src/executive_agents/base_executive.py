@@ -4,11 +4,12 @@ Base Executive Agent
 Defines the core structure and functionality for all executive agents in the platform.
 """
 
-import json
+import asyncio
+import orjson
 from abc import ABC, abstractmethod
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any, Literal, TypedDict
+from typing import Dict, List, Optional, Any, Literal, TypedDict, Callable, Awaitable, Tuple
 from datetime import datetime
 
 
@@ -113,6 +114,115 @@ class ExecutiveContext(TypedDict):
     relevant_metrics: Dict[str, Any]
 
 
+# Chat messages for one LLM request, e.g. [{"role": "system", "content": "..."}, ...]
+PromptMessages = List[Dict[str, str]]
+
+
+class InferenceWorker:
+    """
+    Coalesces concurrent LLM requests into batched provider calls.
+    
+    Executives analyzing the same decision run concurrently on one event loop; instead of
+    one round-trip each, their requests are queued for up to ``max_wait_ms`` and sent
+    together through ``batch_fn``. Requests with different call parameters (model,
+    temperature, ...) are batched separately.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[PromptMessages], Dict[str, Any]], Awaitable[List[str]]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 20
+    ):
+        """
+        Initialize the worker.
+        
+        Args:
+            batch_fn: Coroutine function sending a batch of prompts with shared parameters
+                to the provider and returning one completion per prompt, in order
+            max_batch_size: Number of queued requests that triggers an immediate flush
+            max_wait_ms: Longest time a request waits for others to join its batch
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: List[Tuple[PromptMessages, Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._dispatches = set()
+    
+    async def run(self, messages: PromptMessages, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Queue a request and wait for its completion.
+        
+        Args:
+            messages: Chat messages for the request
+            params: Provider call parameters
+            
+        Returns:
+            The completion text
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((messages, params or {}, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Dispatch all queued requests."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the dispatch isn't garbage collected mid-flight
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[PromptMessages, Dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Send a flushed batch, one provider call per distinct set of parameters.
+        
+        Args:
+            batch: Queued (messages, params, future) entries
+        """
+        groups: Dict[bytes, List[Tuple[PromptMessages, Dict[str, Any], asyncio.Future]]] = {}
+        for entry in batch:
+            key = orjson.dumps(entry[1], option=orjson.OPT_SORT_KEYS, default=str)
+            groups.setdefault(key, []).append(entry)
+        
+        await asyncio.gather(*(self._send_group(group) for group in groups.values()))
+    
+    async def _send_group(self, group: List[Tuple[PromptMessages, Dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Send requests sharing call parameters and resolve their futures.
+        
+        Args:
+            group: Queued entries with equal parameters
+        """
+        try:
+            completions = await self.batch_fn([messages for messages, _, _ in group], group[0][1])
+            if len(completions) != len(group):
+                raise ValueError(
+                    f"Batch returned {len(completions)} completions for {len(group)} prompts"
+                )
+        except Exception as e:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), completion in zip(group, completions):
+            if not future.done():
+                future.set_result(completion)
+
+
 class BaseExecutive(ABC):
     """
     Abstract base class for all executive agents.
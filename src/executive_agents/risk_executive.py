@@ -5,8 +5,16 @@ Specialized executive agent focused on comprehensive risk assessment and mitigat
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Union, ClassVar, Mapping, NamedTuple, Tuple
 import asyncio
+import heapq
+import operator
+from collections import Counter
+
+import numpy as np
 
 from src.executive_agents.base_executive import (
     BaseExecutive,
@@ -19,6 +27,225 @@ from src.executive_agents.base_executive import (
     RecommendationAlternative
 )
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below then run as plain NumPy
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Sort key for assessed risks
+_risk_score = operator.itemgetter("risk_score")
+
+# Residual risk levels indexed by the codes produced by _residual_kernel
+RESIDUAL_RISK_LEVELS = ("low", "medium", "high")
+
+# Mitigations mentioning any of these terms are treated as generic rather than specific
+_GENERIC_MITIGATION_RE = re.compile(r"monitor|review|assess|consider", re.I)
+
+# Risk categories for feedback mentions, checked in priority order
+_CATEGORY_PATTERNS = (
+    (re.compile(r"financial|cost|budget"), "financial_risk"),
+    (re.compile(r"reputation|brand"), "reputational_risk"),
+    (re.compile(r"regulat|compliance|legal"), "compliance_risk"),
+    (re.compile(r"operation|execution"), "operational_risk"),
+    (re.compile(r"strateg|market|competit"), "strategic_risk"),
+)
+
+# Generic mitigations appended to every risk extracted from feedback
+_DEFAULT_MITIGATION_TAIL = ("Implement monitoring mechanisms", "Regular reassessment of this risk area")
+
+# Leading verbs of feedback suggestions mapped to the verb used for the mitigation;
+# suggestions starting with any other word are prefixed with "Implement"
+_MITIGATION_VERBS = {
+    "Implement": "Implement",
+    "Develop": "Develop",
+    "Establish": "Establish",
+    "Add": "Implement",
+    "Include": "Implement",
+}
+
+# Explicit "risk of ..." mentions in feedback, each running up to the next mention
+_RISK_OF_RE = re.compile(r"risk of (.*?)(?=risk of |\Z)", re.S)
+
+# Feedback concern themes, checked in priority order against lower-cased text
+_THEME_PATTERNS = (
+    (re.compile(r"missing risk|additional risk|overlooked risk"), "missing_risks"),
+    (re.compile(r"mitigation|control|prevention"), "mitigation_concerns"),
+    (re.compile(r"assessment|methodology|evaluation"), "risk_assessment_methodology"),
+    (re.compile(r"residual|remaining|post-mitigation"), "residual_risk_concerns"),
+    (re.compile(r"risk"), "general_risk_concerns"),
+)
+
+# Risk-related suggestion themes, checked in priority order against lower-cased text
+_SUGGESTION_THEME_PATTERNS = (
+    (re.compile(r"identification"), "risk_identification_suggestions"),
+    (re.compile(r"mitigation|control"), "mitigation_suggestions"),
+    (re.compile(r"assess|evaluat"), "assessment_suggestions"),
+)
+
+# Governance practices looked for in lower-cased timelines and resource requirements.
+# The timeline pattern uses a lookahead so overlapping terms are all reported in one pass.
+_GOVERNANCE_TIMELINE_RE = re.compile(r"(?=(monitor|review|report))")
+_GOVERNANCE_OWNERSHIP_RE = re.compile(r"owner|responsible")
+
+# Static sections of every full risk recommendation. ExecutiveRecommendation validation
+# copies the top-level containers, so the nested structures are shared and must not be mutated.
+_SUCCESS_METRICS = (
+    "Zero risk events from identified high risks",
+    "Mitigation implementation rate > 90%",
+    "Risk review completion for all high and medium risks",
+    "Stakeholder risk perception surveys"
+)
+
+_UNCERTAINTY_FACTORS = (
+    "Emergent risks not identified in initial assessment",
+    "Changes in external risk landscape",
+    "Mitigation effectiveness variance",
+    "Risk interdependencies and cascade effects"
+)
+
+
+def _implementation_timeline() -> Dict[str, Any]:
+    """Build the standard implementation timeline; fresh per recommendation since callers may edit it."""
+    return {
+        "phases": [
+            {
+                "name": "Initial Risk Mitigation",
+                "duration": "1-2 months",
+                "key_activities": ["Implement high risk mitigations", "Establish monitoring systems", "Stakeholder communication"]
+            },
+            {
+                "name": "Comprehensive Risk Management",
+                "duration": "3-6 months",
+                "key_activities": ["Complete all mitigation implementations", "Regular risk reviews", "Effectiveness measurement"]
+            },
+            {
+                "name": "Continuous Risk Monitoring",
+                "duration": "Ongoing",
+                "key_activities": ["Periodic risk reassessment", "Mitigation refinement", "New risk identification"]
+            }
+        ],
+        "critical_milestones": [
+            {"name": "High Risk Mitigation Complete", "timeline": "Month 1"},
+            {"name": "All Mitigations Implemented", "timeline": "Month 6"},
+            {"name": "First Comprehensive Risk Review", "timeline": "Month 3"}
+        ]
+    }
+
+
+def _resource_requirements() -> Dict[str, Any]:
+    """Build the standard resource requirements; fresh per recommendation since callers may edit them."""
+    return {
+        "financial": {
+            "mitigation_budget": "Requires budget allocation for risk mitigation",
+            "monitoring_costs": "Ongoing investment in risk monitoring",
+            "contingency_reserve": "Recommended contingency for unknown risks"
+        },
+        "personnel": {
+            "risk_owners": "Assigned owners for each significant risk",
+            "expertise_requirements": "Risk management expertise in key areas",
+            "training_needs": "Training for risk monitoring and response"
+        },
+        "systems": {
+            "monitoring_tools": "Risk monitoring and tracking systems",
+            "reporting_infrastructure": "Risk reporting capabilities",
+            "communication_channels": "Stakeholder communication mechanisms"
+        }
+    }
+
+
+# Only offered when residual risk remains unacceptable
+_ENHANCED_MITIGATION_ALTERNATIVE = RecommendationAlternative(
+    title="Enhanced Risk Mitigation",
+    description="Implement additional controls beyond proposed mitigations",
+    strengths=["Further reduces residual risk level", "Increases organizational resilience"],
+    weaknesses=["Requires additional resources", "May delay implementation"],
+    why_not_selected="May be considered if residual risk level is deemed unacceptable"
+)
+
+_STANDARD_ALTERNATIVES = (
+    RecommendationAlternative(
+        title="Risk Transfer Strategy",
+        description="Transfer key risks through insurance, partnerships, or outsourcing",
+        strengths=["Reduces organizational exposure", "Leverages external expertise"],
+        weaknesses=["May increase costs", "Introduces third-party dependencies"],
+        why_not_selected="Direct mitigation offers better control and long-term risk management"
+    ),
+    RecommendationAlternative(
+        title="Phased Risk-Based Approach",
+        description="Implement in phases with risk assessments between stages",
+        strengths=["Allows learning and adaptation", "Smaller risk exposure at each stage"],
+        weaknesses=["Extends implementation timeline", "May reduce overall benefits"],
+        why_not_selected="Can be incorporated within recommended approach if needed"
+    )
+)
+
+_ELEVATED_RISK_ALTERNATIVES = (_ENHANCED_MITIGATION_ALTERNATIVE, *_STANDARD_ALTERNATIVES)
+
+
+@dataclass(frozen=True)
+class _RiskStats:
+    """Risk counts shared by the recommendation evaluators."""
+    # Declared by hand rather than with slots=True, which needs Python 3.10
+    __slots__ = (
+        "risk_count",
+        "category_count",
+        "all_assessed",
+        "risks_with_mitigations",
+        "total_mitigations",
+        "specific_mitigations",
+    )
+    
+    risk_count: int
+    category_count: int
+    all_assessed: bool
+    risks_with_mitigations: int
+    total_mitigations: int
+    specific_mitigations: int
+
+
+class _LoweredFeedback(NamedTuple):
+    """One executive's feedback with every concern and suggestion lower-cased once."""
+    concerns: List[str]
+    suggestions: List[Tuple[str, str]]  # (original, lower-cased) pairs
+
+
+def _lower_feedback(feedback: List[Dict[str, Any]]) -> List[_LoweredFeedback]:
+    """Lower-case all feedback text once so the feedback passes can share it."""
+    return [
+        _LoweredFeedback(
+            concerns=[concern.lower() for concern in exec_feedback.get("concerns", [])],
+            suggestions=[(suggestion, suggestion.lower()) for suggestion in exec_feedback.get("suggestions", [])]
+        )
+        for exec_feedback in feedback
+    ]
+
+
+@njit(cache=True)
+def _residual_kernel(scores, effectiveness):
+    """
+    Compute residual risk scores and level codes for a set of mitigated risks.
+    
+    Args:
+        scores: Original risk scores
+        effectiveness: Mitigation effectiveness for each risk (0-1 scale)
+        
+    Returns:
+        Tuple of (mean original score, mean residual score, residual scores, level codes)
+    """
+    residual = scores * (1.0 - effectiveness)
+    levels = np.empty(residual.size, np.int8)
+    for i in range(residual.size):
+        if residual[i] < 0.15:
+            levels[i] = 0
+        elif residual[i] < 0.3:
+            levels[i] = 1
+        else:
+            levels[i] = 2
+    return scores.mean(), residual.mean(), residual, levels
+
 
 class RiskExecutive(BaseExecutive):
     """
@@ -29,6 +256,22 @@ class RiskExecutive(BaseExecutive):
     Provides comprehensive risk analysis and mitigation strategies.
     """
     
+    # Expertise domains with confidence levels, shared by all instances
+    _EXPERTISE_DOMAINS: ClassVar[Mapping[str, ExpertiseLevel]] = MappingProxyType({
+        "risk_assessment": ExpertiseLevel.EXPERT,
+        "risk_mitigation": ExpertiseLevel.EXPERT,
+        "financial_risk": ExpertiseLevel.ADVANCED,
+        "operational_risk": ExpertiseLevel.ADVANCED,
+        "strategic_risk": ExpertiseLevel.ADVANCED,
+        "compliance_risk": ExpertiseLevel.ADVANCED,
+        "reputational_risk": ExpertiseLevel.ADVANCED,
+        "cybersecurity_risk": ExpertiseLevel.PROFICIENT,
+        "environmental_risk": ExpertiseLevel.PROFICIENT,
+        "geopolitical_risk": ExpertiseLevel.BASIC,
+        "market_risk": ExpertiseLevel.ADVANCED,
+        "credit_risk": ExpertiseLevel.PROFICIENT
+    })
+    
     def __init__(self, name: str = "Risk Executive", model_provider: str = "OpenAI", model_name: str = "gpt-4o"):
         """
         Initialize the Risk Management Executive agent.
@@ -38,33 +281,19 @@ class RiskExecutive(BaseExecutive):
             model_provider: The LLM provider to use
             model_name: The specific model to use
         """
-        # Define expertise domains with confidence levels
-        expertise_domains = {
-            "risk_assessment": ExpertiseLevel.EXPERT,
-            "risk_mitigation": ExpertiseLevel.EXPERT,
-            "financial_risk": ExpertiseLevel.ADVANCED,
-            "operational_risk": ExpertiseLevel.ADVANCED,
-            "strategic_risk": ExpertiseLevel.ADVANCED,
-            "compliance_risk": ExpertiseLevel.ADVANCED,
-            "reputational_risk": ExpertiseLevel.ADVANCED,
-            "cybersecurity_risk": ExpertiseLevel.PROFICIENT,
-            "environmental_risk": ExpertiseLevel.PROFICIENT,
-            "geopolitical_risk": ExpertiseLevel.BASIC,
-            "market_risk": ExpertiseLevel.ADVANCED,
-            "credit_risk": ExpertiseLevel.PROFICIENT
-        }
-        
-        super().__init__(name, "Chief Risk Officer", expertise_domains)
+        super().__init__(name, "Chief Risk Officer", dict(self._EXPERTISE_DOMAINS))
         self.logger = logging.getLogger(__name__)
         self.model_provider = model_provider
         self.model_name = model_name
     
-    async def analyze(self, context: ExecutiveContext) -> ExecutiveRecommendation:
+    async def analyze(self, context: ExecutiveContext, lazy: bool = False) -> ExecutiveRecommendation:
         """
         Analyze the given context and produce a risk-focused recommendation.
         
         Args:
             context: All relevant context for making a risk-based decision
+            lazy: Return an abbreviated recommendation when residual risk is unacceptable;
+                call again with lazy=False to obtain the full detail
             
         Returns:
             An executive recommendation based on risk analysis
@@ -91,7 +320,8 @@ class RiskExecutive(BaseExecutive):
         recommendation = await self._create_recommendation(
             mitigated_risks, 
             residual_risk,
-            context
+            context,
+            lazy=lazy
         )
         
         # Log the decision
@@ -114,13 +344,19 @@ class RiskExecutive(BaseExecutive):
         # In a real implementation, this would use the actual LLM
         # For this prototype, we'll simulate risk evaluation
         
+        # Scan the risks and serialize the scanned sections once for all evaluators
+        stats = self._compute_risk_stats(recommendation)
+        lowered = self._lowered_text(recommendation)
+        residual_summary = self._residual_summary(recommendation)
+        has_residual_analysis = self._has_residual_analysis(recommendation, residual_summary)
+        
         # Extract key risk aspects to evaluate
         risk_aspects = {
-            "risk_identification_completeness": self._evaluate_risk_identification(recommendation),
-            "risk_assessment_quality": self._evaluate_risk_assessment(recommendation),
-            "mitigation_effectiveness": self._evaluate_mitigation_strategies(recommendation),
-            "residual_risk_acceptability": self._evaluate_residual_risk(recommendation),
-            "risk_governance_alignment": self._evaluate_risk_governance(recommendation),
+            "risk_identification_completeness": self._evaluate_risk_identification(stats),
+            "risk_assessment_quality": self._evaluate_risk_assessment(recommendation, stats, has_residual_analysis),
+            "mitigation_effectiveness": self._evaluate_mitigation_strategies(stats),
+            "residual_risk_acceptability": self._evaluate_residual_risk(recommendation, residual_summary, has_residual_analysis),
+            "risk_governance_alignment": self._evaluate_risk_governance(recommendation, lowered),
         }
         
         # Calculate overall risk-based agreement
@@ -188,16 +424,22 @@ class RiskExecutive(BaseExecutive):
         """
         self.logger.info(f"Risk Executive integrating feedback for: {recommendation.title}")
         
-        # Create a modified recommendation
-        updated_recommendation = recommendation.model_copy(deep=True)
+        # Create a modified recommendation, copying only the containers mutated below
+        updated_recommendation = recommendation.model_copy(update={
+            "risks": list(recommendation.risks),
+            "supporting_evidence": list(recommendation.supporting_evidence or []),
+            "uncertainty_factors": list(recommendation.uncertainty_factors or []),
+            "domain_specific_analyses": dict(recommendation.domain_specific_analyses or {})
+        })
         
         # Analyze feedback themes
-        feedback_themes = self._analyze_feedback_themes(feedback)
+        lowered_feedback = _lower_feedback(feedback)
+        feedback_themes = self._analyze_feedback_themes(feedback, lowered_feedback)
         
         # Apply risk adjustments based on feedback
         if "missing_risks" in feedback_themes:
             # Add additional risks
-            new_risks = self._extract_missing_risks(feedback)
+            new_risks = self._extract_missing_risks(feedback, lowered_feedback)
             updated_recommendation.risks.extend(new_risks)
             
             if updated_recommendation.supporting_evidence:
@@ -207,7 +449,7 @@ class RiskExecutive(BaseExecutive):
         
         if "mitigation_concerns" in feedback_themes:
             # Enhance mitigation strategies
-            self._enhance_mitigation_strategies(updated_recommendation, feedback)
+            self._enhance_mitigation_strategies(updated_recommendation, feedback, lowered_feedback)
             
             if updated_recommendation.supporting_evidence:
                 updated_recommendation.supporting_evidence.append(
@@ -248,7 +490,7 @@ class RiskExecutive(BaseExecutive):
             List of identified risks
         """
         # Extract relevant information from context
-        query = context.get("query", "")
+        query = context.get("query", "").lower()
         background = context.get("background_information", {})
         
         # In a real implementation, this would be a comprehensive analysis using the LLM
@@ -257,7 +499,7 @@ class RiskExecutive(BaseExecutive):
         identified_risks = []
         
         # Add strategic risks
-        if "expansion" in query.lower() or "market" in query.lower() or "growth" in query.lower():
+        if "expansion" in query or "market" in query or "growth" in query:
             identified_risks.append({
                 "category": "strategic_risk",
                 "title": "Market Entry Failure",
@@ -273,7 +515,7 @@ class RiskExecutive(BaseExecutive):
             })
         
         # Add financial risks
-        if "investment" in query.lower() or "financial" in query.lower() or "cost" in query.lower():
+        if "investment" in query or "financial" in query or "cost" in query:
             identified_risks.append({
                 "category": "financial_risk",
                 "title": "Capital Expenditure Overrun",
@@ -389,9 +631,6 @@ class RiskExecutive(BaseExecutive):
             
             assessed_risks.append(assessed_risk)
         
-        # Sort by risk score (highest first)
-        assessed_risks.sort(key=lambda x: x["risk_score"], reverse=True)
-        
         return assessed_risks
     
     async def _develop_mitigations(
@@ -505,25 +744,20 @@ class RiskExecutive(BaseExecutive):
                 "acceptable": True
             }
         
-        # Calculate overall original risk
-        original_risk_scores = [risk["risk_score"] for risk in mitigated_risks]
-        overall_original_risk_score = sum(original_risk_scores) / len(original_risk_scores)
-        
-        # Calculate residual risk for each risk
-        for risk in mitigated_risks:
-            risk["residual_risk_score"] = risk["risk_score"] * (1 - risk["mitigation_effectiveness"])
-            
-            # Determine residual risk level
-            if risk["residual_risk_score"] < 0.15:
-                risk["residual_risk_level"] = "low"
-            elif risk["residual_risk_score"] < 0.3:
-                risk["residual_risk_level"] = "medium"
-            else:
-                risk["residual_risk_level"] = "high"
+        # Run the numeric core over score/effectiveness arrays
+        count = len(mitigated_risks)
+        scores = np.fromiter((risk["risk_score"] for risk in mitigated_risks), dtype=np.float64, count=count)
+        effectiveness = np.fromiter(
+            (risk["mitigation_effectiveness"] for risk in mitigated_risks), dtype=np.float64, count=count
+        )
+        original_mean, residual_mean, residual_scores, residual_levels = _residual_kernel(scores, effectiveness)
+        overall_original_risk_score = float(original_mean)
+        overall_residual_risk_score = float(residual_mean)
         
-        # Calculate overall residual risk
-        residual_risk_scores = [risk["residual_risk_score"] for risk in mitigated_risks]
-        overall_residual_risk_score = sum(residual_risk_scores) / len(residual_risk_scores)
+        # Record residual risk for each risk
+        for risk, residual_score, level in zip(mitigated_risks, residual_scores.tolist(), residual_levels.tolist()):
+            risk["residual_risk_score"] = residual_score
+            risk["residual_risk_level"] = RESIDUAL_RISK_LEVELS[level]
         
         # Determine overall residual risk level
         if overall_residual_risk_score < 0.15:
@@ -557,7 +791,8 @@ class RiskExecutive(BaseExecutive):
         self, 
         mitigated_risks: List[Dict[str, Any]],
         residual_risk: Dict[str, Any],
-        context: ExecutiveContext
+        context: ExecutiveContext,
+        lazy: bool = False
     ) -> ExecutiveRecommendation:
         """
         Create a risk-focused recommendation.
@@ -566,6 +801,8 @@ class RiskExecutive(BaseExecutive):
             mitigated_risks: List of risks with mitigation strategies
             residual_risk: Residual risk assessment
             context: Executive context
+            lazy: When residual risk is unacceptable, skip stakeholder impacts, alternatives
+                and implementation detail and include only the top risk
             
         Returns:
             Risk-based executive recommendation
@@ -580,42 +817,68 @@ class RiskExecutive(BaseExecutive):
                 confidence=DecisionConfidence.LOW
             )
         
+        residual_level = residual_risk["overall_residual_risk_level"]
+        
+        # Only the highest-scoring risks are presented, so avoid a full sort
+        top_risks = heapq.nlargest(3, mitigated_risks, key=_risk_score)
+        
         # Determine recommendation type based on residual risk
         if residual_risk["acceptable"]:
             recommendation_title = "Proceed with Risk Mitigation"
-            recommendation_summary = f"Proceed with the proposed action while implementing identified risk mitigations. Residual risk level: {residual_risk['overall_residual_risk_level']}."
+            recommendation_summary = f"Proceed with the proposed action while implementing identified risk mitigations. Residual risk level: {residual_level}."
         else:
             recommendation_title = "Reconsider with Enhanced Risk Mitigation"
-            recommendation_summary = f"Risk level remains elevated ({residual_risk['overall_residual_risk_level']}) after mitigations. Consider additional controls or alternative approaches."
+            recommendation_summary = f"Risk level remains elevated ({residual_level}) after mitigations. Consider additional controls or alternative approaches."
         
         # Create detailed description
         detailed_description = f"""
             A comprehensive risk assessment has identified {len(mitigated_risks)} significant risks across multiple categories.
             The overall initial risk level was {residual_risk['overall_original_risk_level'].upper()}.
             Implementing proposed mitigation strategies would reduce overall risk by {residual_risk['risk_reduction_percentage']:.1f}%.
-            The resulting residual risk level would be {residual_risk['overall_residual_risk_level'].upper()}.
+            The resulting residual risk level would be {residual_level.upper()}.
             
             Key risks requiring attention include:
-            - {mitigated_risks[0]['title']}: {mitigated_risks[0]['impact']} impact, {mitigated_risks[0]['likelihood']} likelihood
-            {f"- {mitigated_risks[1]['title']}: {mitigated_risks[1]['impact']} impact, {mitigated_risks[1]['likelihood']} likelihood" if len(mitigated_risks) > 1 else ""}
+            - {top_risks[0]['title']}: {top_risks[0]['impact']} impact, {top_risks[0]['likelihood']} likelihood
+            {f"- {top_risks[1]['title']}: {top_risks[1]['impact']} impact, {top_risks[1]['likelihood']} likelihood" if len(top_risks) > 1 else ""}
             
             Recommended mitigation strategy focuses on:
-            - {mitigated_risks[0]['mitigations'][0]}
-            - {mitigated_risks[0]['mitigations'][1] if len(mitigated_risks[0]['mitigations']) > 1 else mitigated_risks[1]['mitigations'][0] if len(mitigated_risks) > 1 else "Comprehensive monitoring and review protocol"}
+            - {top_risks[0]['mitigations'][0]}
+            - {top_risks[0]['mitigations'][1] if len(top_risks[0]['mitigations']) > 1 else top_risks[1]['mitigations'][0] if len(top_risks) > 1 else "Comprehensive monitoring and review protocol"}
             
             This assessment determines the residual risk to be {residual_risk['acceptable'] and 'ACCEPTABLE' or 'ELEVATED'} given the proposed mitigations.
         """
         
+        # Aggregate category counts, level counts and mitigation effectiveness in a single pass
+        category_counts = Counter()
+        level_counts = Counter()
+        effectiveness_sum = 0.0
+        for r in mitigated_risks:
+            category_counts[r["category"]] += 1
+            level_counts[r["risk_level"]] += 1
+            effectiveness_sum += r["mitigation_effectiveness"]
+        
         # Create supporting evidence
         supporting_evidence = [
-            f"Comprehensive risk assessment across {len(set(r['category'] for r in mitigated_risks))} risk categories",
-            f"Risk mitigation effectiveness: {sum(r['mitigation_effectiveness'] for r in mitigated_risks)/len(mitigated_risks):.1%} average reduction",
-            f"Residual risk analysis: {residual_risk['overall_residual_risk_level']} overall level"
+            f"Comprehensive risk assessment across {len(category_counts)} risk categories",
+            f"Risk mitigation effectiveness: {effectiveness_sum / len(mitigated_risks):.1%} average reduction",
+            f"Residual risk analysis: {residual_level} overall level"
         ]
         
+        risk_assessment_summary = {
+            "original_risk_score": residual_risk["overall_original_risk_score"],
+            "original_risk_level": residual_risk["overall_original_risk_level"],
+            "residual_risk_score": residual_risk["overall_residual_risk_score"],
+            "residual_risk_level": residual_level,
+            "risk_reduction": f"{residual_risk['risk_reduction_percentage']:.1f}%",
+            "acceptable": residual_risk["acceptable"]
+        }
+        
+        # Rejected recommendations are usually reworked upstream, so keep them brief
+        abbreviated = lazy and not residual_risk["acceptable"]
+        
         # Create risk assessments for recommendation
         risks = []
-        for risk in mitigated_risks[:3]:  # Include top 3 risks
+        for risk in top_risks[:1 if abbreviated else 3]:  # Top 3 risks, or only the top one when abbreviated
             risk_assessment = RiskAssessment(
                 risk_category=risk["category"],
                 likelihood=DecisionConfidence.HIGH if risk["likelihood"] == "high" else 
@@ -629,18 +892,34 @@ class RiskExecutive(BaseExecutive):
             )
             risks.append(risk_assessment)
         
+        if abbreviated:
+            return ExecutiveRecommendation(
+                title=recommendation_title,
+                summary=recommendation_summary,
+                detailed_description=detailed_description,
+                supporting_evidence=supporting_evidence,
+                confidence=DecisionConfidence.MODERATE,
+                risks=risks,
+                domain_specific_analyses={"risk_assessment": risk_assessment_summary},
+                framework_used="Comprehensive Risk Assessment Framework"
+            )
+        
         # Create stakeholder impacts
         stakeholder_impacts = []
         stakeholders = context.get("background_information", {}).get("stakeholders", ["shareholders", "employees", "customers"])
         
+        # Lower each risk description once rather than once per stakeholder
+        described_risks = [(r.get("description", "").lower(), r) for r in mitigated_risks]
+        
         for stakeholder in stakeholders:
             # Determine impact based on risks
-            stakeholder_risks = [r for r in mitigated_risks if stakeholder in r.get("description", "").lower()]
+            stakeholder_risks = [r for description, r in described_risks if stakeholder in description]
             
             if stakeholder_risks:
+                exposure = max(stakeholder_risks, key=_risk_score)
                 impact_level = "negative"
-                description = f"Exposed to {stakeholder_risks[0]['category']} with {stakeholder_risks[0]['impact']} potential impact"
-                mitigation = stakeholder_risks[0]["mitigations"][0]
+                description = f"Exposed to {exposure['category']} with {exposure['impact']} potential impact"
+                mitigation = exposure["mitigations"][0]
             else:
                 impact_level = "neutral"
                 description = "Limited direct risk exposure identified"
@@ -658,169 +937,119 @@ class RiskExecutive(BaseExecutive):
         
         # Create domain-specific analyses
         domain_analyses = {
-            "risk_assessment": {
-                "original_risk_score": residual_risk["overall_original_risk_score"],
-                "original_risk_level": residual_risk["overall_original_risk_level"],
-                "residual_risk_score": residual_risk["overall_residual_risk_score"],
-                "residual_risk_level": residual_risk["overall_residual_risk_level"],
-                "risk_reduction": f"{residual_risk['risk_reduction_percentage']:.1f}%",
-                "acceptable": residual_risk["acceptable"]
-            },
-            "risk_category_analysis": {
-                category: len([r for r in mitigated_risks if r["category"] == category])
-                for category in set(r["category"] for r in mitigated_risks)
-            },
-            "high_risk_count": len([r for r in mitigated_risks if r["risk_level"] == "high"]),
-            "medium_risk_count": len([r for r in mitigated_risks if r["risk_level"] == "medium"]),
-            "low_risk_count": len([r for r in mitigated_risks if r["risk_level"] == "low"])
+            "risk_assessment": risk_assessment_summary,
+            "risk_category_analysis": dict(category_counts),
+            "high_risk_count": level_counts["high"],
+            "medium_risk_count": level_counts["medium"],
+            "low_risk_count": level_counts["low"]
         }
         
-        # Create success metrics
-        success_metrics = [
-            "Zero risk events from identified high risks",
-            "Mitigation implementation rate > 90%",
-            "Risk review completion for all high and medium risks",
-            "Stakeholder risk perception surveys"
-        ]
-        
-        # Create uncertainty factors
-        uncertainty_factors = [
-            "Emergent risks not identified in initial assessment",
-            "Changes in external risk landscape",
-            "Mitigation effectiveness variance",
-            "Risk interdependencies and cascade effects"
-        ]
-        
-        # Create implementation timeline
-        implementation_timeline = {
-            "phases": [
-                {
-                    "name": "Initial Risk Mitigation",
-                    "duration": "1-2 months",
-                    "key_activities": ["Implement high risk mitigations", "Establish monitoring systems", "Stakeholder communication"]
-                },
-                {
-                    "name": "Comprehensive Risk Management",
-                    "duration": "3-6 months",
-                    "key_activities": ["Complete all mitigation implementations", "Regular risk reviews", "Effectiveness measurement"]
-                },
-                {
-                    "name": "Continuous Risk Monitoring",
-                    "duration": "Ongoing",
-                    "key_activities": ["Periodic risk reassessment", "Mitigation refinement", "New risk identification"]
-                }
-            ],
-            "critical_milestones": [
-                {"name": "High Risk Mitigation Complete", "timeline": "Month 1"},
-                {"name": "All Mitigations Implemented", "timeline": "Month 6"},
-                {"name": "First Comprehensive Risk Review", "timeline": "Month 3"}
-            ]
-        }
-        
-        # Create resource requirements
-        resource_requirements = {
-            "financial": {
-                "mitigation_budget": "Requires budget allocation for risk mitigation",
-                "monitoring_costs": "Ongoing investment in risk monitoring",
-                "contingency_reserve": "Recommended contingency for unknown risks"
-            },
-            "personnel": {
-                "risk_owners": "Assigned owners for each significant risk",
-                "expertise_requirements": "Risk management expertise in key areas",
-                "training_needs": "Training for risk monitoring and response"
-            },
-            "systems": {
-                "monitoring_tools": "Risk monitoring and tracking systems",
-                "reporting_infrastructure": "Risk reporting capabilities",
-                "communication_channels": "Stakeholder communication mechanisms"
-            }
-        }
-        
-        # Create alternatives considered
-        alternatives = []
-        
-        # Alternative 1: Enhanced risk mitigation
-        if not residual_risk["acceptable"]:
-            alternatives.append(
-                RecommendationAlternative(
-                    title="Enhanced Risk Mitigation",
-                    description="Implement additional controls beyond proposed mitigations",
-                    strengths=["Further reduces residual risk level", "Increases organizational resilience"],
-                    weaknesses=["Requires additional resources", "May delay implementation"],
-                    why_not_selected="May be considered if residual risk level is deemed unacceptable"
-                )
-            )
-        
-        # Alternative 2: Risk transfer
-        alternatives.append(
-            RecommendationAlternative(
-                title="Risk Transfer Strategy",
-                description="Transfer key risks through insurance, partnerships, or outsourcing",
-                strengths=["Reduces organizational exposure", "Leverages external expertise"],
-                weaknesses=["May increase costs", "Introduces third-party dependencies"],
-                why_not_selected="Direct mitigation offers better control and long-term risk management"
-            )
-        )
-        
-        # Alternative 3: Phased approach
-        alternatives.append(
-            RecommendationAlternative(
-                title="Phased Risk-Based Approach",
-                description="Implement in phases with risk assessments between stages",
-                strengths=["Allows learning and adaptation", "Smaller risk exposure at each stage"],
-                weaknesses=["Extends implementation timeline", "May reduce overall benefits"],
-                why_not_selected="Can be incorporated within recommended approach if needed"
-            )
-        )
-        
-        # Create the final recommendation
+        # Create the final recommendation from the prebuilt shape for the residual risk outcome
+        acceptable = residual_risk["acceptable"]
         recommendation = ExecutiveRecommendation(
             title=recommendation_title,
             summary=recommendation_summary,
             detailed_description=detailed_description,
             supporting_evidence=supporting_evidence,
-            confidence=DecisionConfidence.HIGH if residual_risk["acceptable"] else DecisionConfidence.MODERATE,
-            alternatives_considered=alternatives,
+            confidence=DecisionConfidence.HIGH if acceptable else DecisionConfidence.MODERATE,
+            # Copied so that edits to one recommendation's alternatives can't leak into others
+            alternatives_considered=[
+                alternative.model_copy(deep=True)
+                for alternative in (_STANDARD_ALTERNATIVES if acceptable else _ELEVATED_RISK_ALTERNATIVES)
+            ],
             risks=risks,
             stakeholder_impacts=stakeholder_impacts,
-            resource_requirements=resource_requirements,
-            implementation_timeline=implementation_timeline,
-            success_metrics=success_metrics,
+            resource_requirements=_resource_requirements(),
+            implementation_timeline=_implementation_timeline(),
+            success_metrics=_SUCCESS_METRICS,
             domain_specific_analyses=domain_analyses,
-            uncertainty_factors=uncertainty_factors,
+            uncertainty_factors=_UNCERTAINTY_FACTORS,
             framework_used="Comprehensive Risk Assessment Framework"
         )
         
         return recommendation
     
-    def _evaluate_risk_identification(self, recommendation: ExecutiveRecommendation) -> float:
-        """Evaluate completeness of risk identification."""
-        # Count risks in recommendation
-        risk_count = len(recommendation.risks) if recommendation.risks else 0
-        
-        # Check risk categories covered
+    def _lowered_text(self, recommendation: ExecutiveRecommendation) -> Dict[str, str]:
+        """Lower-cased serializations of the recommendation sections scanned during evaluation."""
+        return {
+            "timeline": str(recommendation.implementation_timeline).lower() if recommendation.implementation_timeline else "",
+            "resources": str(recommendation.resource_requirements).lower() if recommendation.resource_requirements else ""
+        }
+    
+    def _residual_summary(self, recommendation: ExecutiveRecommendation) -> Optional[Dict[str, Any]]:
+        """Return the residual risk summary recorded by a risk recommendation, if present."""
+        summary = (recommendation.domain_specific_analyses or {}).get("risk_assessment")
+        if isinstance(summary, dict) and "residual_risk_level" in summary:
+            return summary
+        return None
+    
+    def _has_residual_analysis(
+        self, 
+        recommendation: ExecutiveRecommendation, 
+        residual_summary: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Check whether the domain-specific analyses address residual risk."""
+        if residual_summary is not None:
+            return True
+        
+        # Other executives' recommendations only mention it in free-form analyses
+        return any(
+            'residual' in str(value).lower()
+            for value in (recommendation.domain_specific_analyses or {}).values()
+        )
+    
+    def _compute_risk_stats(self, recommendation: ExecutiveRecommendation) -> _RiskStats:
+        """Collect the risk counts used by the evaluators in a single pass over the risks."""
+        risks = recommendation.risks or []
         categories = set()
-        for risk in recommendation.risks if recommendation.risks else []:
+        all_assessed = True
+        risks_with_mitigations = 0
+        total_mitigations = 0
+        specific_mitigations = 0
+        
+        for risk in risks:
             categories.add(risk.risk_category)
+            all_assessed = all_assessed and risk.likelihood is not None and risk.impact is not None
+            
+            if risk.mitigation_strategies:
+                risks_with_mitigations += 1
+                total_mitigations += len(risk.mitigation_strategies)
+                # Count specific (non-generic) mitigations
+                for mitigation in risk.mitigation_strategies:
+                    if len(mitigation) > 15 and not _GENERIC_MITIGATION_RE.search(mitigation):
+                        specific_mitigations += 1
+        
+        return _RiskStats(
+            risk_count=len(risks),
+            category_count=len(categories),
+            all_assessed=all_assessed,
+            risks_with_mitigations=risks_with_mitigations,
+            total_mitigations=total_mitigations,
+            specific_mitigations=specific_mitigations
+        )
+    
+    def _evaluate_risk_identification(self, stats: _RiskStats) -> float:
+        """Evaluate completeness of risk identification."""
+        risk_count = stats.risk_count
+        category_count = stats.category_count
         
         # Evaluate based on number of risks and categories
-        if risk_count >= 5 and len(categories) >= 3:
+        if risk_count >= 5 and category_count >= 3:
             return 0.9  # Excellent risk identification
-        elif risk_count >= 3 and len(categories) >= 2:
+        elif risk_count >= 3 and category_count >= 2:
             return 0.7  # Good risk identification
         elif risk_count >= 2:
             return 0.5  # Basic risk identification
         else:
             return 0.3  # Poor risk identification
     
-    def _evaluate_risk_assessment(self, recommendation: ExecutiveRecommendation) -> float:
+    def _evaluate_risk_assessment(
+        self, 
+        recommendation: ExecutiveRecommendation, 
+        stats: _RiskStats, 
+        has_residual_analysis: bool
+    ) -> float:
         """Evaluate quality of risk assessment methodology."""
-        # Check if risks have likelihood and impact assessments
-        has_assessments = all(
-            hasattr(risk, 'likelihood') and hasattr(risk, 'impact')
-            for risk in recommendation.risks if recommendation.risks
-        )
-        
         # Check if domain-specific analyses include risk assessment
         has_risk_analysis = (
             recommendation.domain_specific_analyses and
@@ -830,80 +1059,53 @@ class RiskExecutive(BaseExecutive):
         # Calculate score based on assessment quality
         score = 0.0
         
-        if has_assessments:
+        # Check if risks have likelihood and impact assessments
+        if stats.all_assessed:
             score += 0.5
         
         if has_risk_analysis:
             score += 0.4
         
         # Check for residual risk assessment
-        if recommendation.domain_specific_analyses and any(
-            'residual' in str(value).lower() 
-            for value in recommendation.domain_specific_analyses.values()
-        ):
+        if has_residual_analysis:
             score += 0.1
         
         return min(1.0, score)
     
-    def _evaluate_mitigation_strategies(self, recommendation: ExecutiveRecommendation) -> float:
+    def _evaluate_mitigation_strategies(self, stats: _RiskStats) -> float:
         """Evaluate effectiveness of mitigation strategies."""
         # Check if risks have mitigation strategies
-        if not recommendation.risks:
+        if not stats.risk_count:
             return 0.0
         
-        # Count risks with mitigation strategies
-        risks_with_mitigations = sum(
-            1 for risk in recommendation.risks
-            if hasattr(risk, 'mitigation_strategies') and risk.mitigation_strategies
-        )
-        
         # Calculate percentage of risks with mitigations
-        if len(recommendation.risks) > 0:
-            percentage_with_mitigations = risks_with_mitigations / len(recommendation.risks)
-        else:
-            percentage_with_mitigations = 0.0
+        percentage_with_mitigations = stats.risks_with_mitigations / stats.risk_count
         
         # Evaluate quality of mitigations
         mitigation_quality = 0.0
-        total_mitigations = 0
-        specific_mitigations = 0
-        
-        for risk in recommendation.risks:
-            if hasattr(risk, 'mitigation_strategies') and risk.mitigation_strategies:
-                total_mitigations += len(risk.mitigation_strategies)
-                # Count specific (non-generic) mitigations
-                for mitigation in risk.mitigation_strategies:
-                    if len(mitigation) > 15 and not any(
-                        generic in mitigation.lower() 
-                        for generic in ['monitor', 'review', 'assess', 'consider']
-                    ):
-                        specific_mitigations += 1
-        
-        if total_mitigations > 0:
-            mitigation_quality = specific_mitigations / total_mitigations
+        if stats.total_mitigations > 0:
+            mitigation_quality = stats.specific_mitigations / stats.total_mitigations
         
         # Combine metrics into overall score
         return 0.6 * percentage_with_mitigations + 0.4 * mitigation_quality
     
-    def _evaluate_residual_risk(self, recommendation: ExecutiveRecommendation) -> float:
+    def _evaluate_residual_risk(
+        self, 
+        recommendation: ExecutiveRecommendation, 
+        residual_summary: Optional[Dict[str, Any]], 
+        has_residual_analysis: bool
+    ) -> float:
         """Evaluate residual risk assessment."""
-        # Check if residual risk is addressed
-        has_residual_assessment = False
-        
-        # Check in domain-specific analyses
-        if recommendation.domain_specific_analyses:
-            has_residual_assessment = any(
-                'residual' in str(value).lower() 
-                for value in recommendation.domain_specific_analyses.values()
-            )
-        
-        # Check in detailed description
-        if recommendation.detailed_description:
-            has_residual_assessment = has_residual_assessment or 'residual risk' in recommendation.detailed_description.lower()
+        # Check if residual risk is addressed in domain-specific analyses or the detailed description
+        has_residual_assessment = has_residual_analysis or bool(
+            recommendation.detailed_description and 'residual risk' in recommendation.detailed_description.lower()
+        )
         
         # Check if residual risk level is acceptable
         acceptable_residual = False
-        if recommendation.domain_specific_analyses:
+        if residual_summary is not None:
+            acceptable_residual = bool(residual_summary.get("acceptable"))
+        elif recommendation.domain_specific_analyses:
             for analysis in recommendation.domain_specific_analyses.values():
                 if isinstance(analysis, dict) and 'acceptable' in analysis:
                     acceptable_residual = bool(analysis['acceptable'])
@@ -917,23 +1119,15 @@ class RiskExecutive(BaseExecutive):
         else:
             return 0.3
     
-    def _evaluate_risk_governance(self, recommendation: ExecutiveRecommendation) -> float:
+    def _evaluate_risk_governance(self, recommendation: ExecutiveRecommendation, lowered: Dict[str, str]) -> float:
         """Evaluate alignment with risk governance principles."""
-        # Check for risk management practices
-        has_monitoring = False
-        has_ownership = False
-        has_reporting = False
-        
-        # Check implementation timeline
-        if recommendation.implementation_timeline:
-            timeline_str = str(recommendation.implementation_timeline).lower()
-            has_monitoring = 'monitor' in timeline_str or 'review' in timeline_str
-            has_reporting = 'report' in timeline_str
-        
-        # Check resource requirements
-        if recommendation.resource_requirements:
-            requirements_str = str(recommendation.resource_requirements).lower()
-            has_ownership = 'owner' in requirements_str or 'responsible' in requirements_str
+        # Check implementation timeline for risk management practices
+        timeline_terms = set(_GOVERNANCE_TIMELINE_RE.findall(lowered["timeline"]))
+        has_monitoring = 'monitor' in timeline_terms or 'review' in timeline_terms
+        has_reporting = 'report' in timeline_terms
+        
+        # Check resource requirements for ownership
+        has_ownership = _GOVERNANCE_OWNERSHIP_RE.search(lowered["resources"]) is not None
         
         # Calculate score
         score = 0.0
@@ -946,113 +1140,92 @@ class RiskExecutive(BaseExecutive):
         
         return score
     
-    def _analyze_feedback_themes(self, feedback: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _analyze_feedback_themes(
+        self, 
+        feedback: List[Dict[str, Any]], 
+        lowered_feedback: Optional[List[_LoweredFeedback]] = None
+    ) -> Dict[str, int]:
         """
         Analyze feedback to identify common themes related to risk.
         
         Args:
             feedback: List of feedback from executives
+            lowered_feedback: Pre-lowered feedback shared with the other feedback passes
             
         Returns:
             Dictionary of themes with their frequency
         """
-        themes = {}
+        if lowered_feedback is None:
+            lowered_feedback = _lower_feedback(feedback)
+        
+        themes = Counter()
         
         # Process all feedback
-        for exec_feedback in feedback:
-            concerns = exec_feedback.get("concerns", [])
-            suggestions = exec_feedback.get("suggestions", [])
-            
+        for exec_feedback in lowered_feedback:
             # Process concerns
-            for concern in concerns:
-                concern_lower = concern.lower()
-                
+            for concern_lower in exec_feedback.concerns:
                 # Categorize concerns into risk themes
-                if any(term in concern_lower for term in ["missing risk", "additional risk", "overlooked risk"]):
-                    self._increment_theme(themes, "missing_risks")
-                
-                elif any(term in concern_lower for term in ["mitigation", "control", "prevention"]):
-                    self._increment_theme(themes, "mitigation_concerns")
-                
-                elif any(term in concern_lower for term in ["assessment", "methodology", "evaluation"]):
-                    self._increment_theme(themes, "risk_assessment_methodology")
-                
-                elif any(term in concern_lower for term in ["residual", "remaining", "post-mitigation"]):
-                    self._increment_theme(themes, "residual_risk_concerns")
-                
-                elif "risk" in concern_lower:
-                    self._increment_theme(themes, "general_risk_concerns")
+                for pattern, theme in _THEME_PATTERNS:
+                    if pattern.search(concern_lower):
+                        themes[theme] += 1
+                        break
             
             # Process suggestions
-            for suggestion in suggestions:
-                suggestion_lower = suggestion.lower()
-                
+            for _, suggestion_lower in exec_feedback.suggestions:
                 if "risk" in suggestion_lower:
-                    if "identification" in suggestion_lower:
-                        self._increment_theme(themes, "risk_identification_suggestions")
-                    elif "mitigation" in suggestion_lower or "control" in suggestion_lower:
-                        self._increment_theme(themes, "mitigation_suggestions")
-                    elif "assess" in suggestion_lower or "evaluat" in suggestion_lower:
-                        self._increment_theme(themes, "assessment_suggestions")
+                    for pattern, theme in _SUGGESTION_THEME_PATTERNS:
+                        if pattern.search(suggestion_lower):
+                            themes[theme] += 1
+                            break
                     else:
-                        self._increment_theme(themes, "general_risk_suggestions")
+                        themes["general_risk_suggestions"] += 1
         
-        return themes
-    
-    def _increment_theme(self, themes: Dict[str, int], theme: str) -> None:
-        """Increment a theme counter."""
-        if theme in themes:
-            themes[theme] += 1
-        else:
-            themes[theme] = 1
+        return dict(themes)
     
-    def _extract_missing_risks(self, feedback: List[Dict[str, Any]]) -> List[RiskAssessment]:
+    def _extract_missing_risks(
+        self, 
+        feedback: List[Dict[str, Any]], 
+        lowered_feedback: Optional[List[_LoweredFeedback]] = None
+    ) -> List[RiskAssessment]:
         """
         Extract missing risks mentioned in feedback.
         
         Args:
             feedback: Feedback from executives
+            lowered_feedback: Pre-lowered feedback shared with the other feedback passes
             
         Returns:
             List of additional risk assessments
         """
+        if lowered_feedback is None:
+            lowered_feedback = _lower_feedback(feedback)
+        
         additional_risks = []
         
-        for exec_feedback in feedback:
+        for exec_feedback in lowered_feedback:
             # Look for mentions of risks in concerns and suggestions
-            all_text = " ".join(exec_feedback.get("concerns", []) + exec_feedback.get("suggestions", []))
+            all_text = " ".join(
+                exec_feedback.concerns + [suggestion_lower for _, suggestion_lower in exec_feedback.suggestions]
+            )
             
             # Simple extraction based on keywords
             # In a real implementation, this would use more sophisticated NLP
-            risk_mentions = []
-            
-            # Look for explicit risk mentions
-            if "risk of " in all_text.lower():
-                risk_mentions.extend([
-                    s.strip() 
-                    for s in all_text.lower().split("risk of ")[1:] 
-                    if len(s.strip()) > 0
-                ])
-            
-            # Process risk mentions
-            for mention in risk_mentions:
+            for match in _RISK_OF_RE.finditer(all_text):
+                mention = match.group(1).strip()
+                if not mention:
+                    continue
+                
                 # Extract description - take the first sentence or part
-                description = mention.split(".")[0]
+                description = mention.partition(".")[0]
                 if len(description) > 100:
                     description = description[:100] + "..."
                 
                 # Determine risk category
                 category = "unknown_risk"
-                if "financial" in mention or "cost" in mention or "budget" in mention:
-                    category = "financial_risk"
-                elif "reputation" in mention or "brand" in mention:
-                    category = "reputational_risk"
-                elif "regulat" in mention or "compliance" in mention or "legal" in mention:
-                    category = "compliance_risk"
-                elif "operation" in mention or "execution" in mention:
-                    category = "operational_risk"
-                elif "strateg" in mention or "market" in mention or "competit" in mention:
-                    category = "strategic_risk"
+                for pattern, label in _CATEGORY_PATTERNS:
+                    if pattern.search(mention):
+                        category = label
+                        break
                 
                 # Create risk assessment
                 risk = RiskAssessment(
@@ -1060,11 +1233,7 @@ class RiskExecutive(BaseExecutive):
                     likelihood=DecisionConfidence.MODERATE,  # Default likelihood
                     impact=DecisionConfidence.MODERATE,  # Default impact
                     risk_description=f"Additional risk identified: {description.capitalize()}",
-                    mitigation_strategies=[
-                        f"Develop specific controls for {description}",
-                        "Implement monitoring mechanisms",
-                        "Regular reassessment of this risk area"
-                    ]
+                    mitigation_strategies=[f"Develop specific controls for {description}", *_DEFAULT_MITIGATION_TAIL]
                 )
                 
                 additional_risks.append(risk)
@@ -1074,7 +1243,8 @@ class RiskExecutive(BaseExecutive):
     def _enhance_mitigation_strategies(
         self, 
         recommendation: ExecutiveRecommendation, 
-        feedback: List[Dict[str, Any]]
+        feedback: List[Dict[str, Any]], 
+        lowered_feedback: Optional[List[_LoweredFeedback]] = None
     ) -> None:
         """
         Enhance mitigation strategies based on feedback.
@@ -1082,32 +1252,37 @@ class RiskExecutive(BaseExecutive):
         Args:
             recommendation: Recommendation to enhance
             feedback: Feedback from executives
+            lowered_feedback: Pre-lowered feedback shared with the other feedback passes
         """
         if not recommendation.risks:
             return
         
+        if lowered_feedback is None:
+            lowered_feedback = _lower_feedback(feedback)
+        
         # Extract mitigation suggestions from feedback
         mitigation_suggestions = []
         
-        for exec_feedback in feedback:
-            suggestions = exec_feedback.get("suggestions", [])
-            
-            for suggestion in suggestions:
-                if any(term in suggestion.lower() for term in ["mitigation", "control", "reduce risk", "manage risk"]):
-                    mitigation_suggestions.append(suggestion)
+        for exec_feedback in lowered_feedback:
+            for suggestion, suggestion_lower in exec_feedback.suggestions:
+                if any(term in suggestion_lower for term in ["mitigation", "control", "reduce risk", "manage risk"]):
+                    mitigation_suggestions.append((suggestion, suggestion_lower))
         
         # Enhance existing mitigation strategies
-        for risk in recommendation.risks:
-            if not hasattr(risk, 'mitigation_strategies') or not risk.mitigation_strategies:
-                risk.mitigation_strategies = []
+        for index, risk in enumerate(recommendation.risks):
+            category = risk.risk_category
+            description_words = risk.risk_description.lower().split()[:3]
             
             # Add relevant suggestions as mitigations
             relevant_suggestions = [
-                s for s in mitigation_suggestions
-                if risk.risk_category in s.lower() or any(
-                    word in s.lower() for word in risk.risk_description.lower().split()[:3]
-                )
+                suggestion for suggestion, suggestion_lower in mitigation_suggestions
+                if category in suggestion_lower or any(word in suggestion_lower for word in description_words)
             ]
+            if not relevant_suggestions:
+                continue
+            
+            mitigation_strategies = list(risk.mitigation_strategies)
+            existing_mitigations = set(mitigation_strategies)
             
             # Format as mitigation strategies
             for suggestion in relevant_suggestions[:2]:  # Add up to 2 new mitigations
@@ -1116,15 +1291,20 @@ class RiskExecutive(BaseExecutive):
                 # Clean up the suggestion to make it a proper mitigation
                 if mitigation.startswith("Consider "):
                     mitigation = mitigation[9:]
-                if mitigation.startswith("Implement "):
-                    pass  # Good format already
-                elif mitigation.startswith("Add "):
-                    mitigation = "Implement " + mitigation[4:]
-                elif mitigation.startswith("Include "):
-                    mitigation = "Implement " + mitigation[8:]
-                elif not mitigation.startswith("Develop ") and not mitigation.startswith("Establish "):
+                head, separator, rest = mitigation.partition(" ")
+                verb = _MITIGATION_VERBS.get(head) if separator else None
+                if verb is None:
                     mitigation = "Implement " + mitigation
+                elif verb != head:
+                    mitigation = f"{verb} {rest}"
                 
                 # Add if not already present
-                if mitigation not in risk.mitigation_strategies:
-                    risk.mitigation_strategies.append(mitigation)
\ No newline at end of file
+                if mitigation not in existing_mitigations:
+                    existing_mitigations.add(mitigation)
+                    mitigation_strategies.append(mitigation)
+            
+            # Copy the risk rather than mutating one shared with the original recommendation
+            if len(mitigation_strategies) != len(risk.mitigation_strategies):
+                recommendation.risks[index] = risk.model_copy(
+                    update={"mitigation_strategies": mitigation_strategies}
+                )
\ No newline at end of file
@@ -5,13 +5,23 @@ Specialized executive agent focused on strategy, competitive positioning, and lo
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union
+import functools
+import re
+import heapq
+import operator
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Union, Mapping, Sequence
 import asyncio
 
+import orjson
+
 from src.executive_agents.base_executive import (
     BaseExecutive,
     ExecutiveRecommendation,
     ExecutiveContext,
+    InferenceWorker,
     DecisionConfidence,
     ExpertiseLevel,
     StakeholderImpact,
@@ -20,6 +30,542 @@ from src.executive_agents.base_executive import (
 )
 
 
+@dataclass(frozen=True)
+class StrategicOption:
+    """A strategic option considered by the Strategy Executive."""
+    # Declared by hand rather than with slots=True, which needs Python 3.10
+    __slots__ = (
+        "title",
+        "description",
+        "approach",
+        "resource_intensity",
+        "time_horizon",
+        "risk_level",
+        # Lower-cased text for keyword matching, derived once per option
+        "title_lower",
+        "description_lower",
+    )
+    
+    title: str
+    description: str
+    approach: str
+    resource_intensity: str  # low, medium, high
+    time_horizon: str  # short_term, medium_term, long_term
+    risk_level: str  # low, medium, high
+    
+    def __post_init__(self):
+        object.__setattr__(self, "title_lower", self.title.lower())
+        object.__setattr__(self, "description_lower", self.description.lower())
+
+
+@dataclass(frozen=True)
+class EvaluatedOption(StrategicOption):
+    """A strategic option scored against the organizational priorities."""
+    __slots__ = ("priority_scores", "total_score")
+    
+    priority_scores: Dict[str, float]
+    total_score: float
+    
+    @classmethod
+    def from_option(
+        cls, 
+        option: StrategicOption, 
+        priority_scores: Dict[str, float], 
+        total_score: float
+    ) -> "EvaluatedOption":
+        """Annotate an option with its evaluation."""
+        return cls(
+            option.title,
+            option.description,
+            option.approach,
+            option.resource_intensity,
+            option.time_horizon,
+            option.risk_level,
+            priority_scores,
+            total_score
+        )
+
+
+# Strategic option catalogs returned by _identify_strategic_options; immutable and shared
+# between analyses
+_GROWTH_OPTIONS = (
+    StrategicOption(
+        title="Market Penetration Strategy",
+        description="Increase market share in existing markets with existing products",
+        approach="Aggressive marketing and competitive pricing",
+        resource_intensity="medium",
+        time_horizon="short_term",
+        risk_level="low"
+    ),
+    StrategicOption(
+        title="Market Development Strategy",
+        description="Enter new markets with existing products",
+        approach="Geographic expansion and new customer segments",
+        resource_intensity="high",
+        time_horizon="medium_term",
+        risk_level="medium"
+    ),
+    StrategicOption(
+        title="Product Development Strategy",
+        description="Develop new products for existing markets",
+        approach="R&D investment and innovation focus",
+        resource_intensity="high",
+        time_horizon="medium_term",
+        risk_level="medium"
+    ),
+    StrategicOption(
+        title="Diversification Strategy",
+        description="Develop new products for new markets",
+        approach="Acquisition or internal development",
+        resource_intensity="very_high",
+        time_horizon="long_term",
+        risk_level="high"
+    )
+)
+
+_COMPETITIVE_OPTIONS = (
+    StrategicOption(
+        title="Cost Leadership Strategy",
+        description="Become the lowest-cost producer in the industry",
+        approach="Operational efficiency and economies of scale",
+        resource_intensity="high",
+        time_horizon="long_term",
+        risk_level="medium"
+    ),
+    StrategicOption(
+        title="Differentiation Strategy",
+        description="Create unique products or services",
+        approach="Innovation and brand development",
+        resource_intensity="medium",
+        time_horizon="medium_term",
+        risk_level="medium"
+    ),
+    StrategicOption(
+        title="Focus Strategy",
+        description="Concentrate on a narrow segment and achieve cost leadership or differentiation",
+        approach="Specialized expertise and tailored offerings",
+        resource_intensity="medium",
+        time_horizon="short_term",
+        risk_level="low"
+    )
+)
+
+_DEFAULT_OPTIONS = (
+    StrategicOption(
+        title="Organic Growth Strategy",
+        description="Expand through internal development",
+        approach="Reinvestment of profits and capability building",
+        resource_intensity="medium",
+        time_horizon="long_term",
+        risk_level="low"
+    ),
+    StrategicOption(
+        title="Acquisition Strategy",
+        description="Grow through strategic acquisitions",
+        approach="Identify and integrate complementary businesses",
+        resource_intensity="high",
+        time_horizon="short_term",
+        risk_level="high"
+    ),
+    StrategicOption(
+        title="Strategic Partnership Strategy",
+        description="Establish key partnerships to access new capabilities or markets",
+        approach="Joint ventures and strategic alliances",
+        resource_intensity="low",
+        time_horizon="medium_term",
+        risk_level="medium"
+    )
+)
+
+
+def _is_hashable(value: Any) -> bool:
+    """Whether a value can be used as a cache key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+# typed so that e.g. a market share of 1 and 1.0 keep their own results
+@functools.lru_cache(maxsize=256, typed=True)
+def _current_position(market_share: float, growth_rate: float, competitors: tuple) -> Mapping[str, Any]:
+    """
+    Analyze the current strategic position for a market state.
+    
+    Args:
+        market_share: Current market share
+        growth_rate: Current market growth rate
+        competitors: Known competitors
+        
+    Returns:
+        Read-only analysis of current strategic position, shared between callers
+    """
+    # In a real implementation, this would be a complex analysis using the LLM
+    # For this prototype, we'll return a simplified analysis
+    
+    return MappingProxyType({
+        "market_position": "established",  # established, emerging, leading, declining
+        "competitive_strength": 0.7,  # 0-1 scale
+        "market_share": market_share,
+        "growth_rate": growth_rate,
+        "key_strengths": ("brand_recognition", "product_quality", "distribution_network"),
+        "key_weaknesses": ("cost_structure", "digital_capabilities"),
+        "core_competencies": ("customer_relationships", "industry_expertise"),
+        "competitor_analysis": MappingProxyType({
+            comp: MappingProxyType({"threat_level": "medium"}) for comp in competitors
+        })
+    })
+
+
+# Instruction for the LLM-backed current position analysis
+_CURRENT_POSITION_TASK = (
+    "Assess the organization's current strategic position for this decision. Respond with a "
+    "JSON object with the keys market_position (established, emerging, leading or declining), "
+    "competitive_strength (0-1), key_strengths, key_weaknesses and core_competencies."
+)
+
+# Stakeholder groups assessed when the context names none
+_DEFAULT_STAKEHOLDERS = ("customers", "employees", "shareholders")
+
+# Impact descriptions for stakeholders burdened by resource-heavy or long-term options
+_MIXED_STAKEHOLDER_IMPACTS = {
+    "employees": "Potential for organizational stress during implementation, but long-term growth opportunities",
+    "shareholders": "Short-term investment required, but strong long-term value creation potential"
+}
+
+# Mitigation strategies shared by every recommendation; validation copies them into
+# fresh lists on each model, so the constants themselves are never mutated
+_MIXED_STAKEHOLDER_MITIGATIONS = ("Phased implementation", "Regular stakeholder communication")
+
+_EXECUTION_RISK_MITIGATIONS = (
+    "Detailed implementation roadmap",
+    "Regular milestone reviews",
+    "Dedicated implementation team"
+)
+
+_RESOURCE_RISK_MITIGATIONS = (
+    "Phased resource allocation",
+    "Regular resource review",
+    "Contingency planning for resource constraints"
+)
+
+_COMPETITIVE_RISK_MITIGATIONS = (
+    "Continuous competitive monitoring",
+    "Adaptive strategy mechanism",
+    "Building defensive moats"
+)
+
+_FEEDBACK_EXECUTION_RISK_MITIGATIONS = (
+    "Phased implementation approach",
+    "Dedicated cross-functional implementation team",
+    "Regular milestone reviews with executive team"
+)
+
+# Strategic aspects scored by evaluate_recommendation, in report order:
+# (aspect, scorer method, concern threshold, concern, improvement suggestion, supporting argument)
+_ASPECT_RULES = (
+    (
+        "long_term_alignment", "_evaluate_long_term_alignment", 0.6,
+        "Limited alignment with long-term strategic vision",
+        "Strengthen alignment with 5-year strategic plan",
+        "Strong Long Term Alignment"
+    ),
+    (
+        "competitive_advantage", "_evaluate_competitive_advantage", 0.5,
+        "Does not strengthen competitive position adequately",
+        "Enhance differentiation from key competitors",
+        "Strong Competitive Advantage"
+    ),
+    (
+        "market_position_impact", "_evaluate_market_position", 0.5,
+        "Insufficient impact on market positioning",
+        None,
+        "Strong Market Position Impact"
+    ),
+    (
+        "resource_allocation", "_evaluate_resource_allocation", 0.4,
+        "Suboptimal allocation of strategic resources",
+        None,
+        "Strong Resource Allocation"
+    ),
+    (
+        "business_model_impact", "_evaluate_business_model_impact", None,
+        None,
+        None,
+        "Strong Business Model Impact"
+    )
+)
+
+# Keywords looked for in recommendation descriptions by the strategic aspect scorers
+_LONG_TERM_KEYWORDS = frozenset(("vision", "long-term", "sustainable", "future"))
+_COMPETITIVE_KEYWORDS = frozenset(("competitive", "advantage", "differentiation", "unique", "moat", "positioning"))
+_MARKET_KEYWORDS = frozenset(("market share", "positioning", "segment", "customer", "target", "growth"))
+_BUSINESS_MODEL_KEYWORDS = frozenset(("business model", "revenue", "pricing", "cost", "channel", "value proposition"))
+
+# Finds every aspect keyword in a single scan; the lookahead reports overlapping
+# occurrences too, so the result matches testing each keyword with `in`
+_ASPECT_KEYWORD_RE = re.compile(
+    "(?=({}))".format("|".join(
+        re.escape(keyword)
+        for keyword in sorted(
+            _LONG_TERM_KEYWORDS | _COMPETITIVE_KEYWORDS | _MARKET_KEYWORDS | _BUSINESS_MODEL_KEYWORDS,
+            key=len,
+            reverse=True
+        )
+    ))
+)
+
+# Description keyword aspects scored by _keyword_aspect_scores: (aspect, keywords,
+# domain analysis section, (base, scale) with the section, (base, scale) without it),
+# where score = base + scale * keywords found / keyword count
+_KEYWORD_ASPECTS = (
+    ("competitive_advantage", _COMPETITIVE_KEYWORDS, "competitive", (0.6, 0.4), (0.0, 1.0)),
+    ("market_position_impact", _MARKET_KEYWORDS, "market", (0.7, 0.3), (0.3, 0.4)),
+    ("business_model_impact", _BUSINESS_MODEL_KEYWORDS, None, (0.3, 0.7), (0.3, 0.7))
+)
+
+# Resource plan aspects looked for in resource requirements
+_RESOURCE_ASPECTS = frozenset(("financial", "personnel", "technology", "time"))
+
+# Feedback concern themes in priority order, with the terms identifying each
+_CONCERN_THEME_TERMS = (
+    ("competitive_concerns", ("compete", "competition", "competitor", "market position")),
+    ("financial_viability", ("financ", "cost", "budget", "resource", "investment")),
+    ("risk_concerns", ("risk", "uncertainty", "downside", "failure")),
+    ("implementation_concerns", ("implement", "execution", "operationalize")),
+    ("strategic_alignment", ("align", "fit", "strategy", "vision"))
+)
+
+# Classifies a lower-cased concern in one match: each alternative looks ahead through the
+# whole concern for its theme's terms, so the first theme in priority order wins (not the
+# earliest term in the text) and the matched group's name is the theme
+_CONCERN_THEME_RE = re.compile(
+    "|".join(
+        "^(?=.*?(?P<{}>{}))".format(theme, "|".join(map(re.escape, terms)))
+        for theme, terms in _CONCERN_THEME_TERMS
+    ),
+    re.DOTALL
+)
+
+# Position of the aspects scored by _keyword_aspect_scores in its result
+_KEYWORD_ASPECT_INDEX = {aspect[0]: index for index, aspect in enumerate(_KEYWORD_ASPECTS)}
+
+# Evaluation weights used when the context specifies no organizational priorities
+_DEFAULT_PRIORITY_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "growth": 0.3,
+    "profitability": 0.3,
+    "innovation": 0.2,
+    "sustainability": 0.1,
+    "customer_satisfaction": 0.1
+})
+
+# Options kept by _evaluate_options: the recommendation plus two alternatives
+_EVALUATED_OPTION_COUNT = 3
+
+# Positions of the flags in the tuples produced by _option_features
+(
+    _LONG_TERM,
+    _GROWTH_TITLE,
+    _LOW_RESOURCES,
+    _HIGH_RESOURCES,
+    _DEVELOPMENT_DESCRIPTION,
+    _LOW_RISK,
+    _EXPERIENCE_DESCRIPTION
+) = range(7)
+
+
+def _option_features(option: StrategicOption) -> tuple:
+    """Encode the option attributes used for priority scoring as a row of flags."""
+    description = option.description_lower
+    resource_intensity = option.resource_intensity
+    return (
+        option.time_horizon == "long_term",
+        "growth" in option.title_lower,
+        resource_intensity == "low",
+        resource_intensity == "high",
+        "development" in description,
+        option.risk_level == "low",
+        "experience" in description
+    )
+
+
+def _default_priority_rule(features: tuple) -> float:
+    """Score given to an option for priorities without a specific rule."""
+    return 0.6
+
+
+# Scoring rule per priority, applied to the flags produced by _option_features
+_PRIORITY_RULES = {
+    "growth": lambda features: (
+        0.8 if features[_LONG_TERM] else 0.9 if features[_GROWTH_TITLE] else 0.6
+    ),
+    "profitability": lambda features: (
+        0.9 if features[_LOW_RESOURCES] else 0.5 if features[_HIGH_RESOURCES] else 0.6
+    ),
+    "innovation": lambda features: 0.8 if features[_DEVELOPMENT_DESCRIPTION] else 0.6,
+    "sustainability": lambda features: 0.7 if features[_LOW_RISK] else 0.6,
+    "customer_satisfaction": lambda features: 0.9 if features[_EXPERIENCE_DESCRIPTION] else 0.6
+}
+
+# Alternative strength/weakness labels for the priorities with scoring rules
+_STRENGTH_LABELS = {priority: f"Strong alignment with {priority}" for priority in _PRIORITY_RULES}
+_WEAKNESS_LABELS = {priority: f"Weak alignment with {priority}" for priority in _PRIORITY_RULES}
+
+
+@functools.lru_cache(maxsize=64)
+def _aspect_keywords(description: str) -> frozenset:
+    """
+    Find the aspect keywords present in a recommendation description.
+    
+    Memoized on the raw text, so the description is lower-cased and scanned once however
+    many scorers ask; keying on the (immutable) string rather than attaching the result to
+    the recommendation means an updated description can never see stale results.
+    
+    Args:
+        description: Recommendation description
+        
+    Returns:
+        The keywords that occur in the description, case-insensitively
+    """
+    return frozenset(_ASPECT_KEYWORD_RE.findall(description.lower()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _keyword_aspect_scores(
+    description: str, 
+    has_competitive_analysis: bool, 
+    has_market_analysis: bool
+) -> tuple:
+    """
+    Score the strategic aspects determined by description keywords and analysis sections.
+    
+    These scores depend on nothing else, so they are memoized on exactly these inputs and
+    computed once however often a recommendation is evaluated.
+    
+    Args:
+        description: Recommendation description
+        has_competitive_analysis: Whether there's a competitive analysis section
+        has_market_analysis: Whether there's a market analysis section
+        
+    Returns:
+        Tuple of (competitive advantage, market position impact, business model impact) scores
+    """
+    keywords = _aspect_keywords(description)
+    has_section = {"competitive": has_competitive_analysis, "market": has_market_analysis}
+    
+    scores = []
+    for _, aspect_keywords, section, section_weights, weights in _KEYWORD_ASPECTS:
+        base, scale = section_weights if has_section.get(section, False) else weights
+        scores.append(base + scale * len(keywords & aspect_keywords) / len(aspect_keywords))
+    
+    return tuple(scores)
+
+
+def _covered_resource_aspects(requirements: Mapping[str, Any]) -> int:
+    """
+    Count the resource aspects mentioned in resource requirements.
+    
+    Keys and values are inspected one at a time, descending into nested dictionaries, rather
+    than stringifying the whole structure, and the walk stops as soon as every aspect is found.
+    Each key and value is matched on its repr, so the result is the same as searching
+    str(requirements).
+    
+    Args:
+        requirements: Resource requirements of a recommendation
+        
+    Returns:
+        Number of aspects in _RESOURCE_ASPECTS that are mentioned
+    """
+    remaining = set(_RESOURCE_ASPECTS)
+    pending = [requirements]
+    while pending and remaining:
+        node = pending.pop()
+        if type(node) is dict:
+            for key, value in node.items():
+                text = repr(key).lower()
+                remaining.difference_update([aspect for aspect in remaining if aspect in text])
+                pending.append(value)
+        else:
+            text = repr(node).lower()
+            remaining.difference_update([aspect for aspect in remaining if aspect in text])
+    
+    return len(_RESOURCE_ASPECTS) - len(remaining)
+
+
+def _has_long_phase(timeline: Optional[Mapping[str, Any]]) -> bool:
+    """
+    Check whether an implementation timeline has a long-running phase.
+    
+    Args:
+        timeline: Implementation timeline of a recommendation
+        
+    Returns:
+        True if any phase's duration mentions "long"
+    """
+    for phase in (timeline or {}).get("phases", ()):
+        # Well-formed phases skip the type checks; anything else just doesn't count
+        try:
+            if "long" in phase["duration"]:
+                return True
+        except (TypeError, KeyError):
+            pass
+    return False
+
+
+def _analysis_cache_key(context: ExecutiveContext) -> Optional[tuple]:
+    """
+    Build the cache key for a strategic analysis of the given context.
+    
+    The key holds exactly the context fields the analysis reads, so contexts differing
+    only elsewhere share an entry. The query is case- and whitespace-normalized, which
+    doesn't change the option keywords found in it.
+    
+    Args:
+        context: Executive context
+        
+    Returns:
+        The cache key, or None if the fields read can't be used as a key
+    """
+    background = context.get("background_information", {})
+    market_data = context.get("available_data", {}).get("market_data", {})
+    key = (
+        " ".join(context.get("query", "").lower().split()),
+        market_data.get("market_share", 0.15),
+        market_data.get("growth_rate", 0.05),
+        tuple(background.get("competitors", [])),
+        tuple(background.get("stakeholders", _DEFAULT_STAKEHOLDERS)),
+        tuple(context.get("organizational_priorities", []))
+    )
+    return key if _is_hashable(key) else None
+
+
+@functools.lru_cache(maxsize=32)
+def _build_static_prompt_prefix(role: str, expertise: tuple) -> str:
+    """
+    Build the static system prompt describing an executive's role and expertise.
+    
+    The prefix is byte-identical for an unchanged profile, so providers can cache it
+    across calls; nothing request-specific may be added here.
+    
+    Args:
+        role: Executive role title
+        expertise: (domain, expertise level name) pairs
+        
+    Returns:
+        System prompt text
+    """
+    expertise_lines = "\n".join(
+        f"- {domain.replace('_', ' ')}: {level.lower()}" for domain, level in expertise
+    )
+    return (
+        f"You are the {role} on an executive leadership team.\n"
+        "You evaluate decisions for long-term strategic fit, competitive positioning "
+        "and market impact, and respond with structured, evidence-based analysis.\n"
+        f"Areas of expertise:\n{expertise_lines}"
+    )
+
+
 class StrategyExecutive(BaseExecutive):
     """
     AI executive specializing in strategic planning and competitive positioning.
@@ -28,7 +574,14 @@ class StrategyExecutive(BaseExecutive):
     market positioning, and alignment with organizational vision and mission.
     """
     
-    def __init__(self, name: str = "Strategy Executive", model_provider: str = "OpenAI", model_name: str = "gpt-4o"):
+    def __init__(
+        self, 
+        name: str = "Strategy Executive", 
+        model_provider: str = "OpenAI", 
+        model_name: str = "gpt-4o", 
+        analysis_cache_size: int = 128,
+        inference_worker: Optional[InferenceWorker] = None
+    ):
         """
         Initialize the Strategy Executive agent.
         
@@ -36,6 +589,9 @@ class StrategyExecutive(BaseExecutive):
             name: Name identifier for this executive
             model_provider: The LLM provider to use
             model_name: The specific model to use
+            analysis_cache_size: Maximum number of analyses to reuse for repeated contexts (0 disables)
+            inference_worker: Optional shared worker batching LLM calls with other executives;
+                without one the analysis stages use the built-in simulated results
         """
         # Define expertise domains with confidence levels
         expertise_domains = {
@@ -56,6 +612,43 @@ class StrategyExecutive(BaseExecutive):
         self.logger = logging.getLogger(__name__)
         self.model_provider = model_provider
         self.model_name = model_name
+        self.analysis_cache_size = analysis_cache_size
+        self.inference_worker = inference_worker
+        self._analysis_cache: "OrderedDict[tuple, ExecutiveRecommendation]" = OrderedDict()
+    
+    @property
+    def _static_prompt_prefix(self) -> str:
+        """Static system prompt for this executive's current role and expertise."""
+        return _build_static_prompt_prefix(
+            self.role,
+            tuple((domain, level.name) for domain, level in self.expertise_domains.items())
+        )
+    
+    def _build_prompt_messages(self, task: str, context: ExecutiveContext) -> List[Dict[str, str]]:
+        """
+        Lay out an LLM request so its cacheable parts come first.
+        
+        The static system prompt leads, the decision context follows as its own message
+        (serialized deterministically) and only the task-specific instruction comes last,
+        so a provider-side prompt cache is never invalidated by the per-call text.
+        
+        Args:
+            task: Instruction for the analysis step
+            context: Executive context
+            
+        Returns:
+            Chat messages in system, context, task order
+        """
+        serialized_context = orjson.dumps(
+            context,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+            default=str
+        ).decode()
+        return [
+            {"role": "system", "content": self._static_prompt_prefix},
+            {"role": "user", "content": f"Decision context:\n{serialized_context}"},
+            {"role": "user", "content": task}
+        ]
     
     async def analyze(self, context: ExecutiveContext) -> ExecutiveRecommendation:
         """
@@ -67,24 +660,42 @@ class StrategyExecutive(BaseExecutive):
         Returns:
             An executive recommendation based on strategic analysis
         """
-        self.logger.info(f"Strategy Executive analyzing: {context['query']}")
+        self.logger.info("Strategy Executive analyzing: %s", context['query'])
+        
+        # Reuse a previous analysis of an equivalent context
+        cache_key = _analysis_cache_key(context) if self.analysis_cache_size > 0 else None
+        cached = self._analysis_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            recommendation = cached.model_copy(deep=True)
+            self.log_decision(context, recommendation)
+            return recommendation
         
         # In a real implementation, this would use the actual LLM call
         # For this prototype, we'll simulate a strategic analysis
         
         # Example strategic analysis process:
-        # 1. Analyze current position
-        current_position = await self._analyze_current_position(context)
+        # 1. Analyze current position while deriving priority weights from the context
+        current_position, priority_weights = await asyncio.gather(
+            self._analyze_current_position(context),
+            self._derive_priority_weights(context)
+        )
         
         # 2. Identify strategic options
         strategic_options = await self._identify_strategic_options(context, current_position)
         
         # 3. Evaluate options against strategic goals
-        evaluated_options = await self._evaluate_options(strategic_options, context)
+        evaluated_options = await self._evaluate_options(strategic_options, context, priority_weights)
         
         # 4. Select best option and create recommendation
         recommendation = await self._create_recommendation(evaluated_options, context)
         
+        # Cache a private copy so callers can modify the returned recommendation
+        if cache_key is not None:
+            self._analysis_cache[cache_key] = recommendation.model_copy(deep=True)
+            if len(self._analysis_cache) > self.analysis_cache_size:
+                self._analysis_cache.popitem(last=False)
+        
         # Log the decision
         self.log_decision(context, recommendation)
         
@@ -100,52 +711,40 @@ class StrategyExecutive(BaseExecutive):
         Returns:
             Evaluation results including strategic alignment and concerns
         """
-        self.logger.info(f"Strategy Executive evaluating recommendation: {recommendation.title}")
+        self.logger.info("Strategy Executive evaluating recommendation: %s", recommendation.title)
         
         # In a real implementation, this would use the actual LLM
         # For this prototype, we'll simulate strategic evaluation
         
-        # Extract key strategic aspects to evaluate
-        strategic_aspects = {
-            "long_term_alignment": self._evaluate_long_term_alignment(recommendation),
-            "competitive_advantage": self._evaluate_competitive_advantage(recommendation),
-            "market_position_impact": self._evaluate_market_position(recommendation),
-            "resource_allocation": self._evaluate_resource_allocation(recommendation),
-            "business_model_impact": self._evaluate_business_model_impact(recommendation),
-        }
-        
-        # Calculate overall strategic agreement
-        aspect_scores = [score for _, score in strategic_aspects.items()]
-        agreement_level = sum(aspect_scores) / len(aspect_scores) if aspect_scores else 0.5
-        
-        # Generate strategic concerns
+        # Score each strategic aspect and derive concerns, suggestions and support in one pass
+        strategic_aspects = {}
         concerns = []
-        if strategic_aspects["long_term_alignment"] < 0.6:
-            concerns.append("Limited alignment with long-term strategic vision")
-        
-        if strategic_aspects["competitive_advantage"] < 0.5:
-            concerns.append("Does not strengthen competitive position adequately")
-        
-        if strategic_aspects["market_position_impact"] < 0.5:
-            concerns.append("Insufficient impact on market positioning")
+        suggestions = []
+        supporting_arguments = []
+        total_score = 0.0
         
-        if strategic_aspects["resource_allocation"] < 0.4:
-            concerns.append("Suboptimal allocation of strategic resources")
+        # The description keyword aspects are scored together from the text and sections
+        keyword_scores = self._keyword_aspect_scores(recommendation)
         
-        # Generate supporting arguments
-        supporting_arguments = []
-        for aspect, score in strategic_aspects.items():
+        for aspect, scorer_name, threshold, concern, suggestion, support in _ASPECT_RULES:
+            keyword_index = _KEYWORD_ASPECT_INDEX.get(aspect)
+            if keyword_index is not None:
+                score = keyword_scores[keyword_index]
+            else:
+                score = getattr(self, scorer_name)(recommendation)
+            strategic_aspects[aspect] = score
+            total_score += score
+            
+            if threshold is not None and score < threshold:
+                concerns.append(concern)
+                if suggestion:
+                    suggestions.append(suggestion)
+            
             if score > 0.7:
-                aspect_name = aspect.replace("_", " ").title()
-                supporting_arguments.append(f"Strong {aspect_name}")
+                supporting_arguments.append(support)
         
-        # Generate improvement suggestions
-        suggestions = []
-        if strategic_aspects["long_term_alignment"] < 0.6:
-            suggestions.append("Strengthen alignment with 5-year strategic plan")
-        
-        if strategic_aspects["competitive_advantage"] < 0.5:
-            suggestions.append("Enhance differentiation from key competitors")
+        # Calculate overall strategic agreement
+        agreement_level = total_score / len(strategic_aspects)
         
         if not supporting_arguments:
             supporting_arguments.append("Acceptable strategic foundation but requires refinement")
@@ -174,38 +773,43 @@ class StrategyExecutive(BaseExecutive):
         Returns:
             An updated recommendation incorporating the feedback
         """
-        self.logger.info(f"Strategy Executive integrating feedback for: {recommendation.title}")
-        
-        # Create a modified recommendation
-        updated_recommendation = recommendation.model_copy(deep=True)
+        self.logger.info("Strategy Executive integrating feedback for: %s", recommendation.title)
         
         # Analyze feedback themes
         feedback_themes = self._analyze_feedback_themes(feedback)
         
+        # Collect the changed fields as fresh containers; everything else is shared with the original
+        updates: Dict[str, Any] = {
+            # Note the framework used to integrate feedback
+            "framework_used": "Strategic-Integrative Feedback Synthesis"
+        }
+        
         # Apply strategic adjustments based on feedback
         if "competitive_concerns" in feedback_themes:
             # Enhance competitive differentiation aspects
-            if not updated_recommendation.domain_specific_analyses:
-                updated_recommendation.domain_specific_analyses = {}
-            
-            updated_recommendation.domain_specific_analyses["competitive_analysis"] = {
-                "feedback_integrated": "Enhanced competitive differentiation",
-                "original_assessment": updated_recommendation.domain_specific_analyses.get("competitive_analysis", {})
+            domain_analyses = recommendation.domain_specific_analyses or {}
+            updates["domain_specific_analyses"] = {
+                **domain_analyses,
+                "competitive_analysis": {
+                    "feedback_integrated": "Enhanced competitive differentiation",
+                    "original_assessment": domain_analyses.get("competitive_analysis", {})
+                }
             }
             
             # Add to supporting evidence
-            updated_recommendation.supporting_evidence.append(
+            updates["supporting_evidence"] = [
+                *recommendation.supporting_evidence,
                 "Competitive differentiation enhanced based on cross-functional input"
-            )
+            ]
         
         if "financial_viability" in feedback_themes:
             # Adjust resource requirements based on financial feedback
-            if not updated_recommendation.resource_requirements:
-                updated_recommendation.resource_requirements = {}
-            
-            updated_recommendation.resource_requirements["financial_adjustments"] = {
-                "description": "Resource requirements adjusted based on financial executive feedback",
-                "optimization_applied": True
+            updates["resource_requirements"] = {
+                **(recommendation.resource_requirements or {}),
+                "financial_adjustments": {
+                    "description": "Resource requirements adjusted based on financial executive feedback",
+                    "optimization_applied": True
+                }
             }
         
         if "risk_concerns" in feedback_themes:
@@ -215,33 +819,30 @@ class StrategyExecutive(BaseExecutive):
                 likelihood=DecisionConfidence.MODERATE,
                 impact=DecisionConfidence.HIGH,
                 risk_description="Risk of execution challenges identified through cross-functional feedback",
-                mitigation_strategies=[
-                    "Phased implementation approach",
-                    "Dedicated cross-functional implementation team",
-                    "Regular milestone reviews with executive team"
-                ]
+                mitigation_strategies=_FEEDBACK_EXECUTION_RISK_MITIGATIONS
             )
             
-            updated_recommendation.risks.append(new_risk)
+            updates["risks"] = [*recommendation.risks, new_risk]
         
         # Update uncertainty factors
-        if not updated_recommendation.uncertainty_factors:
-            updated_recommendation.uncertainty_factors = []
-        
-        updated_recommendation.uncertainty_factors.append(
+        updates["uncertainty_factors"] = [
+            *(recommendation.uncertainty_factors or []),
             "Cross-functional consensus limitations identified during executive review"
-        )
+        ]
         
         # Adjust implementation timeline if it exists
-        if updated_recommendation.implementation_timeline:
-            updated_recommendation.implementation_timeline["adjusted_for_feedback"] = True
+        if recommendation.implementation_timeline:
+            updates["implementation_timeline"] = {
+                **recommendation.implementation_timeline,
+                "adjusted_for_feedback": True
+            }
         
-        # Note the framework used to integrate feedback
-        updated_recommendation.framework_used = "Strategic-Integrative Feedback Synthesis"
+        # Create the modified recommendation in a single shallow copy
+        updated_recommendation = recommendation.model_copy(update=updates)
         
         return updated_recommendation
     
-    async def _analyze_current_position(self, context: ExecutiveContext) -> Dict[str, Any]:
+    async def _analyze_current_position(self, context: ExecutiveContext) -> Mapping[str, Any]:
         """
         Analyze the current strategic position.
         
@@ -255,25 +856,41 @@ class StrategyExecutive(BaseExecutive):
         market_data = context.get("available_data", {}).get("market_data", {})
         competitors = context.get("background_information", {}).get("competitors", [])
         
-        # In a real implementation, this would be a complex analysis using the LLM
-        # For this prototype, we'll return a simplified analysis
+        # The analysis only depends on these inputs, so equal market states share one result
+        position_inputs = (
+            market_data.get("market_share", 0.15),
+            market_data.get("growth_rate", 0.05),
+            tuple(competitors)
+        )
+        if _is_hashable(position_inputs):
+            position = _current_position(*position_inputs)
+        else:
+            # Unhashable market data can't be cached; analyze it directly
+            position = _current_position.__wrapped__(*position_inputs)
         
-        return {
-            "market_position": "established",  # established, emerging, leading, declining
-            "competitive_strength": 0.7,  # 0-1 scale
-            "market_share": market_data.get("market_share", 0.15),
-            "growth_rate": market_data.get("growth_rate", 0.05),
-            "key_strengths": ["brand_recognition", "product_quality", "distribution_network"],
-            "key_weaknesses": ["cost_structure", "digital_capabilities"],
-            "core_competencies": ["customer_relationships", "industry_expertise"],
-            "competitor_analysis": {comp: {"threat_level": "medium"} for comp in competitors}
-        }
+        if self.inference_worker is None:
+            return position
+        
+        response = await self.inference_worker.run(
+            self._build_prompt_messages(_CURRENT_POSITION_TASK, context),
+            {"model": self.model_name, "provider": self.model_provider}
+        )
+        try:
+            llm_position = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            self.logger.warning("Unparseable position analysis from LLM; using baseline analysis")
+            return position
+        if not isinstance(llm_position, dict):
+            return position
+        
+        # Fields the model leaves out keep their baseline values
+        return MappingProxyType({**position, **llm_position})
     
     async def _identify_strategic_options(
         self, 
         context: ExecutiveContext, 
-        current_position: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+        current_position: Mapping[str, Any]
+    ) -> Sequence[StrategicOption]:
         """
         Identify potential strategic options based on context and current position.
         
@@ -287,180 +904,100 @@ class StrategyExecutive(BaseExecutive):
         # In a real implementation, this would generate options using the LLM
         # For this prototype, we'll return predefined options
         
-        query = context.get("query", "")
+        query = context.get("query", "").lower()
         
-        # Generate different options depending on the type of query
-        if "expansion" in query.lower() or "growth" in query.lower():
-            return [
-                {
-                    "title": "Market Penetration Strategy",
-                    "description": "Increase market share in existing markets with existing products",
-                    "approach": "Aggressive marketing and competitive pricing",
-                    "resource_intensity": "medium",
-                    "time_horizon": "short_term",
-                    "risk_level": "low"
-                },
-                {
-                    "title": "Market Development Strategy",
-                    "description": "Enter new markets with existing products",
-                    "approach": "Geographic expansion and new customer segments",
-                    "resource_intensity": "high",
-                    "time_horizon": "medium_term",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Product Development Strategy",
-                    "description": "Develop new products for existing markets",
-                    "approach": "R&D investment and innovation focus",
-                    "resource_intensity": "high",
-                    "time_horizon": "medium_term",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Diversification Strategy",
-                    "description": "Develop new products for new markets",
-                    "approach": "Acquisition or internal development",
-                    "resource_intensity": "very_high",
-                    "time_horizon": "long_term",
-                    "risk_level": "high"
-                }
-            ]
-        elif "competitive" in query.lower() or "position" in query.lower():
-            return [
-                {
-                    "title": "Cost Leadership Strategy",
-                    "description": "Become the lowest-cost producer in the industry",
-                    "approach": "Operational efficiency and economies of scale",
-                    "resource_intensity": "high",
-                    "time_horizon": "long_term",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Differentiation Strategy",
-                    "description": "Create unique products or services",
-                    "approach": "Innovation and brand development",
-                    "resource_intensity": "medium",
-                    "time_horizon": "medium_term",
-                    "risk_level": "medium"
-                },
-                {
-                    "title": "Focus Strategy",
-                    "description": "Concentrate on a narrow segment and achieve cost leadership or differentiation",
-                    "approach": "Specialized expertise and tailored offerings",
-                    "resource_intensity": "medium",
-                    "time_horizon": "short_term",
-                    "risk_level": "low"
-                }
-            ]
+        # Select options depending on the type of query
+        if "expansion" in query or "growth" in query:
+            return _GROWTH_OPTIONS
+        elif "competitive" in query or "position" in query:
+            return _COMPETITIVE_OPTIONS
         else:
             # Default options
-            return [
-                {
-                    "title": "Organic Growth Strategy",
-                    "description": "Expand through internal development",
-                    "approach": "Reinvestment of profits and capability building",
-                    "resource_intensity": "medium",
-                    "time_horizon": "long_term",
-                    "risk_level": "low"
-                },
-                {
-                    "title": "Acquisition Strategy",
-                    "description": "Grow through strategic acquisitions",
-                    "approach": "Identify and integrate complementary businesses",
-                    "resource_intensity": "high",
-                    "time_horizon": "short_term",
-                    "risk_level": "high"
-                },
-                {
-                    "title": "Strategic Partnership Strategy",
-                    "description": "Establish key partnerships to access new capabilities or markets",
-                    "approach": "Joint ventures and strategic alliances",
-                    "resource_intensity": "low",
-                    "time_horizon": "medium_term",
-                    "risk_level": "medium"
-                }
-            ]
+            return _DEFAULT_OPTIONS
+    
+    async def _derive_priority_weights(self, context: ExecutiveContext) -> Mapping[str, float]:
+        """
+        Derive evaluation weights from the organizational priorities in the context.
+        
+        Args:
+            context: Executive context
+            
+        Returns:
+            Weight for each priority
+        """
+        # Get organizational priorities
+        priorities = context.get("organizational_priorities", [])
+        
+        # Weigh the priorities equally; fall back to the shared defaults if none specified
+        if not priorities:
+            return _DEFAULT_PRIORITY_WEIGHTS
+        return dict.fromkeys(priorities, 1.0 / len(priorities))
     
     async def _evaluate_options(
         self, 
-        options: List[Dict[str, Any]], 
-        context: ExecutiveContext
-    ) -> List[Dict[str, Any]]:
+        options: Sequence[StrategicOption], 
+        context: ExecutiveContext, 
+        priority_weights: Optional[Mapping[str, float]] = None
+    ) -> List[EvaluatedOption]:
         """
         Evaluate strategic options against organizational priorities and constraints.
         
         Args:
             options: List of strategic options
             context: Executive context
+            priority_weights: Weights derived from the context; derived here if not given
             
         Returns:
-            Evaluated strategic options with scores
+            The highest-scoring evaluated options with scores, best first
         """
-        # Get organizational priorities
-        priorities = context.get("organizational_priorities", [])
+        if priority_weights is None:
+            priority_weights = await self._derive_priority_weights(context)
         
-        # Create priority weights (default equal if none specified)
-        priority_weights = {}
-        if priorities:
-            weight = 1.0 / len(priorities)
-            for priority in priorities:
-                priority_weights[priority] = weight
-        else:
-            # Default priorities if none specified
-            priority_weights = {
-                "growth": 0.3,
-                "profitability": 0.3,
-                "innovation": 0.2,
-                "sustainability": 0.1,
-                "customer_satisfaction": 0.1
-            }
+        if not options:
+            return []
         
-        # Evaluate each option
-        evaluated_options = []
-        
-        for option in options:
-            # Simulate evaluation scores for each priority
-            priority_scores = {}
-            for priority, weight in priority_weights.items():
-                # In a real implementation, this would be a more sophisticated evaluation
-                if priority == "growth" and option.get("time_horizon") == "long_term":
-                    score = 0.8
-                elif priority == "growth" and "growth" in option.get("title", "").lower():
-                    score = 0.9
-                elif priority == "profitability" and option.get("resource_intensity") == "low":
-                    score = 0.9
-                elif priority == "profitability" and option.get("resource_intensity") == "high":
-                    score = 0.5
-                elif priority == "innovation" and "development" in option.get("description", "").lower():
-                    score = 0.8
-                elif priority == "sustainability" and option.get("risk_level") == "low":
-                    score = 0.7
-                elif priority == "customer_satisfaction" and "experience" in option.get("description", "").lower():
-                    score = 0.9
-                else:
-                    # Default score
-                    score = 0.6
-                
-                priority_scores[priority] = score
-            
-            # Calculate weighted total score
-            total_score = sum(score * priority_weights[priority] for priority, score in priority_scores.items())
-            
-            # Add evaluation to the option
-            option_with_evaluation = option.copy()
-            option_with_evaluation["priority_scores"] = priority_scores
-            option_with_evaluation["total_score"] = total_score
+        # Score every option against the weighted priorities
+        scored_options = [self._score_option(option, priority_weights) for option in options]
+        
+        # Add evaluations to the options
+        evaluated_options = (
+            EvaluatedOption.from_option(option, priority_scores, total_score)
+            for option, (priority_scores, total_score) in zip(options, scored_options)
+        )
+        
+        # Keep the recommended option and the runner-ups considered as alternatives,
+        # highest score first (ties keep catalog order)
+        return heapq.nlargest(_EVALUATED_OPTION_COUNT, evaluated_options, key=operator.attrgetter("total_score"))
+    
+    def _score_option(self, option: StrategicOption, priority_weights: Mapping[str, float]) -> tuple:
+        """
+        Score a single option against the weighted priorities.
+        
+        Args:
+            option: Strategic option
+            priority_weights: Weight for each priority
             
-            evaluated_options.append(option_with_evaluation)
+        Returns:
+            Tuple of (score per priority, weighted total score)
+        """
+        # Lower-case and look up the option attributes once rather than per priority
+        features = _option_features(option)
+        
+        # Simulate evaluation scores for each priority
+        # In a real implementation, this would be a more sophisticated evaluation
+        priority_scores = {
+            priority: _PRIORITY_RULES.get(priority, _default_priority_rule)(features)
+            for priority in priority_weights
+        }
         
-        # Sort by total score (highest first)
-        evaluated_options.sort(key=lambda x: x["total_score"], reverse=True)
+        # Calculate weighted total score
+        total_score = sum(score * priority_weights[priority] for priority, score in priority_scores.items())
         
-        return evaluated_options
+        return priority_scores, total_score
     
     async def _create_recommendation(
         self, 
-        evaluated_options: List[Dict[str, Any]], 
+        evaluated_options: List[EvaluatedOption], 
         context: ExecutiveContext
     ) -> ExecutiveRecommendation:
         """
@@ -483,35 +1020,123 @@ class StrategyExecutive(BaseExecutive):
                 confidence=DecisionConfidence.LOW
             )
         
-        # Select the highest-scoring option
+        # Select the highest-scoring option and read the attributes used below once
         best_option = evaluated_options[0]
+        title = best_option.title
+        description = best_option.description
+        approach = best_option.approach
+        total_score = best_option.total_score
+        formatted_score = f"{total_score:.2f}"
+        
+        # Build the sections of the recommendation
+        alternatives = self._build_alternatives(evaluated_options)
+        stakeholder_impacts = self._build_stakeholder_impacts(best_option, context)
+        risks = self._build_risks(best_option)
+        domain_analyses = self._build_domain_analyses(best_option)
+        implementation_timeline = self._build_implementation_timeline()
+        resource_requirements = self._build_resource_requirements(best_option)
+        
+        # Create success metrics
+        success_metrics = [
+            f"Increase in {metric}" for metric in ["market_share", "revenue", "customer_satisfaction", "brand_equity"]
+        ]
+        
+        # Create uncertainty factors
+        uncertainty_factors = [
+            "Market evolution pace and direction",
+            "Competitive landscape changes",
+            "Regulatory environment shifts",
+            "Resource availability constraints"
+        ]
+        
+        # Lead-in phrases from the domain analyses and the best-aligned priorities for the text below
+        strengths_phrase = ', '.join(domain_analyses['strategic_alignment'].get('analysis', '').split()[:5])
+        competitive_phrase = ' '.join(domain_analyses['competitive_analysis'].get('analysis', '').split()[:5])
+        strong_priorities = ', '.join([priority for priority, score in best_option.priority_scores.items() if score > 0.7])
         
-        # Create alternatives from other options
+        # Create the final recommendation
+        recommendation = ExecutiveRecommendation(
+            title=title,
+            summary=f"Recommended approach: {description} through {approach}.",
+            detailed_description=f"""
+                The recommended strategy is to pursue a {title} approach, which involves {description}.
+                This will be accomplished through {approach}.
+                
+                This strategy aligns with our organizational priorities with a strategic alignment score of {formatted_score}.
+                The resource intensity is {best_option.resource_intensity} with a {best_option.time_horizon} time horizon.
+                
+                Key strengths of this approach include {strengths_phrase}.
+                The competitive positioning will be enhanced through {competitive_phrase}.
+            """,
+            supporting_evidence=[
+                f"Strategic alignment score of {formatted_score}",
+                f"Strong fit with organizational priorities ({strong_priorities})",
+                f"Addresses key market opportunities as identified in context analysis",
+                f"Leverages core organizational competencies"
+            ],
+            confidence=DecisionConfidence.HIGH if total_score > 0.8 else DecisionConfidence.MODERATE,
+            alternatives_considered=alternatives,
+            risks=risks,
+            stakeholder_impacts=stakeholder_impacts,
+            resource_requirements=resource_requirements,
+            implementation_timeline=implementation_timeline,
+            success_metrics=success_metrics,
+            domain_specific_analyses=domain_analyses,
+            uncertainty_factors=uncertainty_factors,
+            framework_used="Strategic Option Evaluation Framework"
+        )
+        
+        return recommendation
+    
+    def _build_alternatives(self, evaluated_options: List[EvaluatedOption]) -> List[RecommendationAlternative]:
+        """Create alternatives from the runner-up options."""
+        best_score = f"{evaluated_options[0].total_score:.2f}"
         alternatives = []
-        for option in evaluated_options[1:3]:  # Take next 2 highest scoring options
+        for option in evaluated_options[1:_EVALUATED_OPTION_COUNT]:  # Take next 2 highest scoring options
+            # Partition the priorities into strengths and weaknesses in one pass
+            strengths = []
+            weaknesses = []
+            for priority, score in option.priority_scores.items():
+                if score > 0.7:
+                    strengths.append(_STRENGTH_LABELS.get(priority) or f"Strong alignment with {priority}")
+                elif score < 0.4:
+                    weaknesses.append(_WEAKNESS_LABELS.get(priority) or f"Weak alignment with {priority}")
+            
             alternative = RecommendationAlternative(
-                title=option["title"],
-                description=option["description"],
-                strengths=[f"Strong alignment with {p}" for p, s in option["priority_scores"].items() if s > 0.7],
-                weaknesses=[f"Weak alignment with {p}" for p, s in option["priority_scores"].items() if s < 0.4],
-                why_not_selected=f"Lower overall strategic alignment (score: {option['total_score']:.2f}) compared to recommended option (score: {best_option['total_score']:.2f})"
+                title=option.title,
+                description=option.description,
+                strengths=strengths,
+                weaknesses=weaknesses,
+                why_not_selected=f"Lower overall strategic alignment (score: {option.total_score:.2f}) compared to recommended option (score: {best_score})"
             )
             alternatives.append(alternative)
         
-        # Create stakeholder impacts
+        return alternatives
+    
+    def _build_stakeholder_impacts(
+        self, 
+        best_option: EvaluatedOption, 
+        context: ExecutiveContext
+    ) -> List[StakeholderImpact]:
+        """Create stakeholder impacts for the selected option."""
         stakeholder_impacts = []
-        stakeholders = context.get("background_information", {}).get("stakeholders", ["customers", "employees", "shareholders"])
+        stakeholders = context.get("background_information", {}).get("stakeholders", _DEFAULT_STAKEHOLDERS)
+        
+        # Stakeholders facing a mixed impact from this option; everyone else benefits
+        mixed_impacts = {}
+        if best_option.resource_intensity == "high":
+            mixed_impacts["employees"] = _MIXED_STAKEHOLDER_IMPACTS["employees"]
+        if best_option.time_horizon == "long_term":
+            mixed_impacts["shareholders"] = _MIXED_STAKEHOLDER_IMPACTS["shareholders"]
+        positive_description = f"Positive impact through improved {best_option.approach}"
         
         for stakeholder in stakeholders:
-            impact_level = "positive"
-            if stakeholder == "employees" and best_option.get("resource_intensity") == "high":
-                impact_level = "mixed"
-                description = "Potential for organizational stress during implementation, but long-term growth opportunities"
-            elif stakeholder == "shareholders" and best_option.get("time_horizon") == "long_term":
-                impact_level = "mixed"
-                description = "Short-term investment required, but strong long-term value creation potential"
+            description = mixed_impacts.get(stakeholder)
+            if description is None:
+                impact_level = "positive"
+                description = positive_description
             else:
-                description = f"Positive impact through improved {best_option.get('approach', 'strategic positioning')}"
+                impact_level = "mixed"
             
             stakeholder_impacts.append(
                 StakeholderImpact(
@@ -519,70 +1144,64 @@ class StrategyExecutive(BaseExecutive):
                     impact_level=impact_level,
                     impact_description=description,
                     confidence=DecisionConfidence.MODERATE,
-                    mitigation_strategies=["Phased implementation", "Regular stakeholder communication"] if impact_level == "mixed" else None
+                    mitigation_strategies=_MIXED_STAKEHOLDER_MITIGATIONS if impact_level == "mixed" else None
                 )
             )
         
-        # Create risk assessments
+        return stakeholder_impacts
+    
+    def _build_risks(self, best_option: EvaluatedOption) -> List[RiskAssessment]:
+        """Create risk assessments for the selected option."""
         risks = []
-        if best_option.get("risk_level") == "high":
+        if best_option.risk_level == "high":
             risks.append(
                 RiskAssessment(
                     risk_category="execution_risk",
                     likelihood=DecisionConfidence.HIGH,
                     impact=DecisionConfidence.HIGH,
                     risk_description="Significant complexity in execution may lead to implementation challenges",
-                    mitigation_strategies=[
-                        "Detailed implementation roadmap",
-                        "Regular milestone reviews",
-                        "Dedicated implementation team"
-                    ]
+                    mitigation_strategies=_EXECUTION_RISK_MITIGATIONS
                 )
             )
         
-        if best_option.get("resource_intensity") == "high":
+        if best_option.resource_intensity == "high":
             risks.append(
                 RiskAssessment(
                     risk_category="resource_risk",
                     likelihood=DecisionConfidence.MODERATE,
                     impact=DecisionConfidence.HIGH,
                     risk_description="Substantial resource requirements may strain organizational capacity",
-                    mitigation_strategies=[
-                        "Phased resource allocation",
-                        "Regular resource review",
-                        "Contingency planning for resource constraints"
-                    ]
+                    mitigation_strategies=_RESOURCE_RISK_MITIGATIONS
                 )
             )
         
-        if "competitive" in best_option.get("description", "").lower():
+        if "competitive" in best_option.description_lower:
             risks.append(
                 RiskAssessment(
                     risk_category="competitive_risk",
                     likelihood=DecisionConfidence.MODERATE,
                     impact=DecisionConfidence.HIGH,
                     risk_description="Competitor responses may reduce effectiveness of strategy",
-                    mitigation_strategies=[
-                        "Continuous competitive monitoring",
-                        "Adaptive strategy mechanism",
-                        "Building defensive moats"
-                    ]
+                    mitigation_strategies=_COMPETITIVE_RISK_MITIGATIONS
                 )
             )
         
-        # Create domain-specific analyses
+        return risks
+    
+    def _build_domain_analyses(self, best_option: EvaluatedOption) -> Dict[str, Any]:
+        """Create domain-specific analyses for the selected option."""
         domain_analyses = {
             "strategic_alignment": {
                 "organizational_fit": 0.8,
                 "long_term_vision_alignment": 0.85,
                 "core_competency_utilization": 0.75,
-                "analysis": f"The {best_option['title']} leverages our existing strengths while addressing key strategic gaps."
+                "analysis": f"The {best_option.title} leverages our existing strengths while addressing key strategic gaps."
             },
             "competitive_analysis": {
                 "differentiation_potential": 0.7,
                 "defensibility": 0.65,
                 "competitive_response_risk": 0.6,
-                "analysis": f"Strategy provides meaningful differentiation but competitors may be able to respond within {best_option.get('time_horizon', 'medium_term')}."
+                "analysis": f"Strategy provides meaningful differentiation but competitors may be able to respond within {best_option.time_horizon}."
             },
             "market_analysis": {
                 "market_growth_alignment": 0.75,
@@ -592,20 +1211,10 @@ class StrategyExecutive(BaseExecutive):
             }
         }
         
-        # Create success metrics
-        success_metrics = [
-            f"Increase in {metric}" for metric in ["market_share", "revenue", "customer_satisfaction", "brand_equity"]
-        ]
-        
-        # Create uncertainty factors
-        uncertainty_factors = [
-            "Market evolution pace and direction",
-            "Competitive landscape changes",
-            "Regulatory environment shifts",
-            "Resource availability constraints"
-        ]
-        
-        # Create implementation timeline
+        return domain_analyses
+    
+    def _build_implementation_timeline(self) -> Dict[str, Any]:
+        """Create the implementation timeline."""
         implementation_timeline = {
             "phases": [
                 {
@@ -637,107 +1246,51 @@ class StrategyExecutive(BaseExecutive):
             ]
         }
         
-        # Create resource requirements
+        return implementation_timeline
+    
+    def _build_resource_requirements(self, best_option: EvaluatedOption) -> Dict[str, Any]:
+        """Create resource requirements for the selected option."""
+        resource_intensity = best_option.resource_intensity
         resource_requirements = {
             "financial": {
                 "initial_investment": "$X million",
                 "ongoing_operational_cost": "$Y million/year",
-                "expected_roi_timeline": f"{best_option.get('time_horizon', 'medium_term')}"
+                "expected_roi_timeline": best_option.time_horizon
             },
             "personnel": {
-                "new_roles_required": best_option.get("resource_intensity") == "high",
+                "new_roles_required": resource_intensity == "high",
                 "skill_development_needed": True,
                 "key_capabilities": ["Strategic execution", "Change management", "Performance monitoring"]
             },
             "technology": {
-                "new_systems_required": best_option.get("resource_intensity") in ["high", "very_high"],
+                "new_systems_required": resource_intensity in ("high", "very_high"),
                 "integration_requirements": "Moderate"
             }
         }
         
-        # Create the final recommendation
-        recommendation = ExecutiveRecommendation(
-            title=best_option["title"],
-            summary=f"Recommended approach: {best_option['description']} through {best_option['approach']}.",
-            detailed_description=f"""
-                The recommended strategy is to pursue a {best_option['title']} approach, which involves {best_option['description']}.
-                This will be accomplished through {best_option['approach']}.
-                
-                This strategy aligns with our organizational priorities with a strategic alignment score of {best_option['total_score']:.2f}.
-                The resource intensity is {best_option['resource_intensity']} with a {best_option['time_horizon']} time horizon.
-                
-                Key strengths of this approach include {', '.join(domain_analyses['strategic_alignment'].get('analysis', '').split()[:5])}.
-                The competitive positioning will be enhanced through {domain_analyses['competitive_analysis'].get('analysis', '').split()[:5]}.
-            """,
-            supporting_evidence=[
-                f"Strategic alignment score of {best_option['total_score']:.2f}",
-                f"Strong fit with organizational priorities ({', '.join(k for k, v in best_option.get('priority_scores', {}).items() if v > 0.7)})",
-                f"Addresses key market opportunities as identified in context analysis",
-                f"Leverages core organizational competencies"
-            ],
-            confidence=DecisionConfidence.HIGH if best_option["total_score"] > 0.8 else DecisionConfidence.MODERATE,
-            alternatives_considered=alternatives,
-            risks=risks,
-            stakeholder_impacts=stakeholder_impacts,
-            resource_requirements=resource_requirements,
-            implementation_timeline=implementation_timeline,
-            success_metrics=success_metrics,
-            domain_specific_analyses=domain_analyses,
-            uncertainty_factors=uncertainty_factors,
-            framework_used="Strategic Option Evaluation Framework"
-        )
-        
-        return recommendation
+        return resource_requirements
     
     def _evaluate_long_term_alignment(self, recommendation: ExecutiveRecommendation) -> float:
         """Evaluate alignment with long-term strategy."""
         # In a real implementation, this would be a more sophisticated evaluation
         # For this prototype, we'll use a simple heuristic
         
-        long_term_indicators = [
-            "vision" in recommendation.detailed_description.lower(),
-            "long-term" in recommendation.detailed_description.lower(),
-            "sustainable" in recommendation.detailed_description.lower(),
-            "future" in recommendation.detailed_description.lower(),
-            any("long" in timeline for timeline in recommendation.implementation_timeline.get("phases", [{}]) if isinstance(timeline, dict) and "duration" in timeline)
-        ]
+        # Count the indicators present: the long-term keywords plus a long-running phase
+        indicator_count = (
+            len(_aspect_keywords(recommendation.detailed_description) & _LONG_TERM_KEYWORDS)
+            + _has_long_phase(recommendation.implementation_timeline)
+        )
         
         # Calculate alignment score
-        return sum(1 for indicator in long_term_indicators if indicator) / len(long_term_indicators)
+        return indicator_count / (len(_LONG_TERM_KEYWORDS) + 1)
     
     def _evaluate_competitive_advantage(self, recommendation: ExecutiveRecommendation) -> float:
         """Evaluate competitive advantage implications."""
-        # Look for competitive advantage keywords
-        competitive_keywords = ["competitive", "advantage", "differentiation", "unique", "moat", "positioning"]
-        
-        # Check for presence in recommendation
-        keyword_presence = sum(1 for keyword in competitive_keywords if keyword in recommendation.detailed_description.lower())
-        
-        # Check if there's a competitive analysis section
-        has_competitive_analysis = "competitive" in recommendation.domain_specific_analyses
-        
-        # Calculate score
-        if has_competitive_analysis:
-            return 0.6 + (0.4 * keyword_presence / len(competitive_keywords))
-        else:
-            return keyword_presence / len(competitive_keywords)
+        return self._keyword_aspect_scores(recommendation)[0]
     
     def _evaluate_market_position(self, recommendation: ExecutiveRecommendation) -> float:
         """Evaluate impact on market positioning."""
-        # Check for market analysis
-        has_market_analysis = "market" in recommendation.domain_specific_analyses
-        
-        # Look for market position keywords
-        market_keywords = ["market share", "positioning", "segment", "customer", "target", "growth"]
-        
-        # Check presence in recommendation
-        keyword_presence = sum(1 for keyword in market_keywords if keyword in recommendation.detailed_description.lower())
-        
-        # Calculate score
-        if has_market_analysis:
-            return 0.7 + (0.3 * keyword_presence / len(market_keywords))
-        else:
-            return 0.3 + (0.4 * keyword_presence / len(market_keywords))
+        return self._keyword_aspect_scores(recommendation)[1]
     
     def _evaluate_resource_allocation(self, recommendation: ExecutiveRecommendation) -> float:
         """Evaluate strategic resource allocation."""
@@ -748,22 +1301,23 @@ class StrategyExecutive(BaseExecutive):
             return 0.3  # Low score if resources not considered
         
         # Check comprehensiveness of resource planning
-        resource_aspects = ["financial", "personnel", "technology", "time"]
-        covered_aspects = sum(1 for aspect in resource_aspects if aspect in str(recommendation.resource_requirements).lower())
+        covered_aspects = _covered_resource_aspects(recommendation.resource_requirements)
         
         # Calculate score
-        return 0.5 + (0.5 * covered_aspects / len(resource_aspects))
+        return 0.5 + (0.5 * covered_aspects / len(_RESOURCE_ASPECTS))
     
     def _evaluate_business_model_impact(self, recommendation: ExecutiveRecommendation) -> float:
         """Evaluate impact on business model."""
-        # Look for business model keywords
-        model_keywords = ["business model", "revenue", "pricing", "cost", "channel", "value proposition"]
-        
-        # Check presence in recommendation
-        keyword_presence = sum(1 for keyword in model_keywords if keyword in recommendation.detailed_description.lower())
-        
-        # Calculate score
-        return 0.3 + (0.7 * keyword_presence / len(model_keywords))
+        return self._keyword_aspect_scores(recommendation)[2]
+    
+    def _keyword_aspect_scores(self, recommendation: ExecutiveRecommendation) -> tuple:
+        """Look up the description keyword scores shared by the aspect scorers."""
+        domain_analyses = recommendation.domain_specific_analyses
+        return _keyword_aspect_scores(
+            recommendation.detailed_description,
+            "competitive" in domain_analyses,
+            "market" in domain_analyses
+        )
     
     def _analyze_feedback_themes(self, feedback: List[Dict[str, Any]]) -> Dict[str, int]:
         """
@@ -775,39 +1329,15 @@ class StrategyExecutive(BaseExecutive):
         Returns:
             Dictionary of themes with their frequency
         """
-        themes = {}
+        themes = Counter()
         
         # Process all feedback
         for exec_feedback in feedback:
             concerns = exec_feedback.get("concerns", [])
             
             for concern in concerns:
-                concern_lower = concern.lower()
-                
                 # Categorize concerns into themes
-                if any(term in concern_lower for term in ["compete", "competition", "competitor", "market position"]):
-                    self._increment_theme(themes, "competitive_concerns")
-                
-                elif any(term in concern_lower for term in ["financ", "cost", "budget", "resource", "investment"]):
-                    self._increment_theme(themes, "financial_viability")
-                
-                elif any(term in concern_lower for term in ["risk", "uncertainty", "downside", "failure"]):
-                    self._increment_theme(themes, "risk_concerns")
-                
-                elif any(term in concern_lower for term in ["implement", "execution", "operationalize"]):
-                    self._increment_theme(themes, "implementation_concerns")
-                
-                elif any(term in concern_lower for term in ["align", "fit", "strategy", "vision"]):
-                    self._increment_theme(themes, "strategic_alignment")
-                
-                else:
-                    self._increment_theme(themes, "other_concerns")
+                match = _CONCERN_THEME_RE.match(concern.lower())
+                themes[match.lastgroup if match else "other_concerns"] += 1
         
-        return themes
-    
-    def _increment_theme(self, themes: Dict[str, int], theme: str) -> None:
-        """Increment a theme counter."""
-        if theme in themes:
-            themes[theme] += 1
-        else:
-            themes[theme] = 1
\ No newline at end of file
+        return dict(themes)
@@ -7,7 +7,8 @@ and consensus building.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union, TypedDict
+from collections import deque
+from typing import Dict, List, Any, Optional, Union, TypedDict, Tuple, Deque, FrozenSet
 from pydantic import BaseModel, Field
 from datetime import datetime
 import uuid
@@ -32,6 +33,15 @@ from src.consensus.consensus_builder import (
 )
 
 
+# Framework suited to each level of decision complexity
+_COMPLEXITY_FRAMEWORKS: Dict[ComplexityLevel, str] = {
+    ComplexityLevel.SIMPLE: "eisenhower_matrix",
+    ComplexityLevel.COMPLICATED: "kepner_tregoe",
+    ComplexityLevel.COMPLEX: "cynefin",
+    ComplexityLevel.CHAOTIC: "ooda",
+}
+
+
 class DecisionRequest(BaseModel):
     """Request for a decision from the executive team."""
     query: str = Field(..., description="The decision query or question")
@@ -50,7 +60,7 @@ class TeamMember(TypedDict):
     """Information about an executive team member."""
     executive: BaseExecutive
     role_priority: Dict[str, int]  # Maps decision domains to priority level for this executive
-    veto_rights: List[str]  # Domains where this executive has veto authority
+    veto_rights: FrozenSet[str]  # Domains where this executive has veto authority
     is_active: bool
 
 
@@ -64,6 +74,8 @@ class ExecutiveTeamConfig(BaseModel):
     enable_veto: bool = Field(True, description="Whether executives can veto in their domain")
     log_decisions: bool = Field(True, description="Whether to log decision history")
     auto_select_framework: bool = Field(True, description="Automatically select best framework")
+    max_decision_history: Optional[int] = Field(1000, ge=1, description="Most recent decisions kept in memory, per team and per executive (all if None)")
+    decision_log_path: Optional[str] = Field(None, description="JSON Lines file every logged decision is appended to")
 
 
 class DecisionOutcome(BaseModel):
@@ -102,11 +114,22 @@ class ExecutiveTeamOrchestrator:
         self.logger = logging.getLogger(__name__)
         self.executives: Dict[str, TeamMember] = {}
         self.frameworks: Dict[str, BaseDecisionFramework] = {}
+        self._fallback_framework: Optional[BaseDecisionFramework] = None
         self.consensus_builder = ConsensusBuilder(
             consensus_threshold=self.config.consensus_threshold,
             min_participation=self.config.min_executive_participation
         )
-        self.decision_history: List[DecisionOutcome] = []
+        self.decision_history: Deque[DecisionOutcome] = deque(maxlen=self.config.max_decision_history)
+        # Domain -> [(priority, executive name)], highest priority first, ties in registration order
+        self._domain_index: Dict[str, List[Tuple[int, str]]] = {}
+        self._registration_order: Dict[str, int] = {}
+        # Domain -> names of executives holding veto rights in it
+        self._veto_index: Dict[str, List[str]] = {}
+        self._active_names = set()
+        # Aggregates over all logged decisions, including those no longer in decision_history
+        self._decision_count = 0
+        self._framework_usage: Dict[str, int] = {}
+        self._executive_stats: Dict[str, Dict[str, Any]] = {}
     
     def register_executive(
         self,
@@ -125,10 +148,30 @@ class ExecutiveTeamOrchestrator:
         self.executives[executive.name] = {
             "executive": executive,
             "role_priority": role_priority,
-            "veto_rights": veto_rights or [],
+            "veto_rights": frozenset(veto_rights or ()),
             "is_active": True
         }
-        self.logger.info(f"Registered executive: {executive.name} ({executive.role})")
+        self._active_names.add(executive.name)
+        self._rebuild_executive_indexes()
+        self.logger.info("Registered executive: %s (%s)", executive.name, executive.role)
+    
+    def _rebuild_executive_indexes(self) -> None:
+        """Rebuild the domain and veto indexes used to select executives and check for vetos."""
+        domain_index: Dict[str, List[Tuple[int, str]]] = {}
+        veto_index: Dict[str, List[str]] = {}
+        for name, member in self.executives.items():
+            for domain, priority in member["role_priority"].items():
+                if priority > 0:
+                    domain_index.setdefault(domain, []).append((priority, name))
+            for domain in member["veto_rights"]:
+                veto_index.setdefault(domain, []).append(name)
+        
+        for entries in domain_index.values():
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+        
+        self._domain_index = domain_index
+        self._veto_index = veto_index
+        self._registration_order = {name: position for position, name in enumerate(self.executives)}
     
     def register_framework(self, framework: BaseDecisionFramework) -> None:
         """
@@ -138,7 +181,9 @@ class ExecutiveTeamOrchestrator:
             framework: The decision framework to register
         """
         self.frameworks[framework.name.lower().replace(" ", "_")] = framework
-        self.logger.info(f"Registered decision framework: {framework.name}")
+        # The first registered framework is used when the selected one isn't registered
+        self._fallback_framework = next(iter(self.frameworks.values()))
+        self.logger.info("Registered decision framework: %s", framework.name)
     
     def deactivate_executive(self, executive_name: str) -> bool:
         """
@@ -152,7 +197,8 @@ class ExecutiveTeamOrchestrator:
         """
         if executive_name in self.executives:
             self.executives[executive_name]["is_active"] = False
-            self.logger.info(f"Deactivated executive: {executive_name}")
+            self._active_names.discard(executive_name)
+            self.logger.info("Deactivated executive: %s", executive_name)
             return True
         return False
     
@@ -168,7 +214,8 @@ class ExecutiveTeamOrchestrator:
         """
         if executive_name in self.executives:
             self.executives[executive_name]["is_active"] = True
-            self.logger.info(f"Reactivated executive: {executive_name}")
+            self._active_names.add(executive_name)
+            self.logger.info("Reactivated executive: %s", executive_name)
             return True
         return False
     
@@ -191,14 +238,18 @@ class ExecutiveTeamOrchestrator:
         Returns:
             Complete decision outcome
         """
-        self.logger.info(f"Starting decision process for: {request.query}")
+        self.logger.info("Starting decision process for: %s", request.query)
         
         # 1. Select relevant executives based on the decision domains
         selected_executives = self._select_relevant_executives(request)
         
         # 2. Choose appropriate decision framework
         framework_name = self._select_decision_framework(request)
-        framework = self.frameworks.get(framework_name, next(iter(self.frameworks.values())))
+        framework = self.frameworks.get(framework_name)
+        if framework is None:
+            if self._fallback_framework is None:
+                raise ValueError("No decision frameworks registered")
+            framework = self._fallback_framework
         
         # 3. Prepare contexts
         executive_context = self._prepare_executive_context(request)
@@ -227,7 +278,7 @@ class ExecutiveTeamOrchestrator:
         
         while (consensus_outcome.consensus_level.value in ["divided_opinion", "strong_disagreement"] and 
                resolution_attempts < self.config.max_resolution_attempts):
-            self.logger.info(f"Decision requires resolution attempt {resolution_attempts+1}")
+            self.logger.info("Decision requires resolution attempt %d", resolution_attempts + 1)
             
             # Update recommendation based on feedback
             updated_recommendation = await lead_executive.integrate_feedback(
@@ -250,14 +301,17 @@ class ExecutiveTeamOrchestrator:
         
         # 8. Check if we need human escalation
         if consensus_outcome.support_percentage < self.config.human_escalation_threshold:
-            self.logger.warning(f"Decision requires human escalation due to low consensus: {consensus_outcome.support_percentage:.1%}")
+            self.logger.warning(
+                "Decision requires human escalation due to low consensus: %.1f%%",
+                consensus_outcome.support_percentage * 100
+            )
             human_escalated = True
             # In a real implementation, this would trigger a human review process
         
         # 9. Check for executive vetos
         veto_result = self._check_for_vetos(consensus_outcome, evaluations)
         if veto_result["veto_applied"]:
-            self.logger.warning(f"Decision vetoed by {veto_result['veto_executive']}")
+            self.logger.warning("Decision vetoed by %s", veto_result["veto_executive"])
             human_escalated = True
             # In a real implementation, this would trigger a human review process
         
@@ -284,7 +338,9 @@ class ExecutiveTeamOrchestrator:
         
         # 11. Log decision if configured
         if self.config.log_decisions:
-            self.decision_history.append(decision_outcome)
+            self._record_decision(decision_outcome)
+            if self.config.decision_log_path:
+                await asyncio.to_thread(self._append_to_decision_log, decision_outcome)
         
         return decision_outcome
     
@@ -299,7 +355,7 @@ class ExecutiveTeamOrchestrator:
             List of selected executives with additional information
         """
         # Get domains from the request
-        domains = set(request.required_domains)
+        domains = frozenset(request.required_domains)
         
         # If no domains specified, consider all domains
         if not domains:
@@ -310,27 +366,18 @@ class ExecutiveTeamOrchestrator:
                 if member["is_active"]
             ]
         
-        # Select executives with relevant expertise
-        selected = []
-        for name, member in self.executives.items():
-            if not member["is_active"]:
-                continue
-                
-            # Calculate priority for this executive based on domain match
-            max_priority = 0
-            for domain in domains:
-                if domain in member["role_priority"]:
-                    max_priority = max(max_priority, member["role_priority"][domain])
-            
-            # Include executive if they have relevant expertise
-            if max_priority > 0:
-                selected.append({
-                    "executive": member["executive"],
-                    "priority": max_priority
-                })
+        # Find each active executive's highest priority across the required domains
+        priorities: Dict[str, int] = {}
+        for domain in domains:
+            for priority, name in self._domain_index.get(domain, ()):
+                if name in self._active_names and priority > priorities.get(name, 0):
+                    priorities[name] = priority
         
-        # Sort by priority (highest first)
-        selected.sort(key=lambda x: x["priority"], reverse=True)
+        # Sort by priority (highest first), keeping registration order for ties
+        selected = [
+            {"executive": self.executives[name]["executive"], "priority": priorities[name]}
+            for name in sorted(priorities, key=lambda name: (-priorities[name], self._registration_order[name]))
+        ]
         
         # Ensure we have at least one executive
         if not selected and self.executives:
@@ -380,14 +427,7 @@ class ExecutiveTeamOrchestrator:
         
         # If complexity is specified, select based on that
         if request.complexity_level:
-            if request.complexity_level == ComplexityLevel.SIMPLE:
-                return "eisenhower_matrix"
-            elif request.complexity_level == ComplexityLevel.COMPLICATED:
-                return "kepner_tregoe"
-            elif request.complexity_level == ComplexityLevel.COMPLEX:
-                return "cynefin"
-            elif request.complexity_level == ComplexityLevel.CHAOTIC:
-                return "ooda"
+            return _COMPLEXITY_FRAMEWORKS[request.complexity_level]
         
         # If high urgency, prefer faster frameworks
         if request.urgency >= 4:
@@ -468,26 +508,18 @@ class ExecutiveTeamOrchestrator:
         Returns:
             List of consensus evaluations
         """
-        evaluations = []
-        evaluation_tasks = []
-        
-        for exec_info in selected_executives:
-            executive = exec_info["executive"]
-            
-            # Skip the lead executive who made the recommendation
-            if executive.name == lead_executive.name:
-                continue
-            
-            # Create task for getting evaluation
-            task = self._get_executive_evaluation(executive, recommendation, context, exec_info["priority"])
-            evaluation_tasks.append(task)
+        # Skip the lead executive who made the recommendation
+        lead_name = lead_executive.name
+        evaluation_tasks = [
+            self._get_executive_evaluation(exec_info["executive"], recommendation, context, exec_info["priority"])
+            for exec_info in selected_executives
+            if exec_info["executive"].name != lead_name
+        ]
         
         # Wait for all evaluations
-        if evaluation_tasks:
-            gathered_evaluations = await asyncio.gather(*evaluation_tasks)
-            evaluations.extend(gathered_evaluations)
-        
-        return evaluations
+        if not evaluation_tasks:
+            return []
+        return list(await asyncio.gather(*evaluation_tasks))
     
     async def _get_executive_evaluation(
         self,
@@ -593,47 +625,102 @@ class ExecutiveTeamOrchestrator:
             return {"veto_applied": False}
         
         # Extract domains from the recommendation
-        recommendation_domains = []
-        if hasattr(consensus_outcome.recommendation, "domain_specific_analyses"):
-            recommendation_domains = list(consensus_outcome.recommendation.domain_specific_analyses.keys())
+        recommendation_domains = consensus_outcome.recommendation.domain_specific_analyses.keys()
+        
+        # Find active executives holding veto rights in the recommendation's domains
+        veto_holders = {
+            name
+            for domain in recommendation_domains
+            for name in self._veto_index.get(domain, ())
+            if name in self._active_names
+        }
+        if not veto_holders:
+            return {"veto_applied": False}
         
-        # Check each executive with veto rights
-        for name, member in self.executives.items():
-            if not member["is_active"]:
-                continue
-                
-            # Check if this executive has veto rights in relevant domains
-            has_veto_authority = False
-            for domain in recommendation_domains:
-                if domain in member["veto_rights"]:
-                    has_veto_authority = True
-                    break
-            
-            if not has_veto_authority:
-                continue
-                
-            # Check if this executive strongly opposes the recommendation
-            for evaluation in evaluations:
-                if evaluation.evaluator_id == name and evaluation.agreement_level < 0.2:
-                    return {
-                        "veto_applied": True,
-                        "veto_executive": name,
-                        "veto_role": member["executive"].role,
-                        "veto_domain": [domain for domain in recommendation_domains if domain in member["veto_rights"]][0],
-                        "agreement_level": evaluation.agreement_level,
-                        "concerns": evaluation.concerns
-                    }
-        
-        return {"veto_applied": False}
+        # Find the first strong objection from each veto holder
+        objections: Dict[str, ConsensusEvaluation] = {}
+        for evaluation in evaluations:
+            if evaluation.agreement_level < 0.2 and evaluation.evaluator_id in veto_holders:
+                objections.setdefault(evaluation.evaluator_id, evaluation)
+        
+        if not objections:
+            return {"veto_applied": False}
+        
+        # The earliest registered objecting executive applies the veto
+        name = min(objections, key=self._registration_order.__getitem__)
+        member = self.executives[name]
+        evaluation = objections[name]
+        return {
+            "veto_applied": True,
+            "veto_executive": name,
+            "veto_role": member["executive"].role,
+            "veto_domain": next(domain for domain in recommendation_domains if domain in member["veto_rights"]),
+            "agreement_level": evaluation.agreement_level,
+            "concerns": evaluation.concerns
+        }
+    
+    def _record_decision(self, decision: DecisionOutcome) -> None:
+        """
+        Append a decision to the history and update the insight aggregates.
+        
+        Args:
+            decision: The decision outcome to record
+        """
+        self.decision_history.append(decision)
+        self._decision_count += 1
+        
+        framework = decision.selected_framework
+        self._framework_usage[framework] = self._framework_usage.get(framework, 0) + 1
+        
+        lead_name = decision.decision_metrics.get("lead_executive")
+        for name in decision.participating_executives:
+            stats = self._executive_stats.get(name)
+            if stats is None:
+                stats = self._executive_stats[name] = {
+                    "participated": 0,
+                    "lead": 0,
+                    "support_sum": 0,
+                    # Like decision_history, only the most recent decisions are kept
+                    "decisions": deque(maxlen=self.config.max_decision_history)
+                }
+            stats["participated"] += 1
+            if lead_name == name:
+                stats["lead"] += 1
+            stats["support_sum"] += decision.consensus.support_percentage
+            stats["decisions"].append(
+                {"id": decision.decision_id, "query": decision.query, "timestamp": decision.timestamp}
+            )
     
-    def get_decision_history(self) -> List[DecisionOutcome]:
+    def _append_to_decision_log(self, decision: DecisionOutcome) -> None:
+        """
+        Append a decision to the configured JSON Lines decision log.
+        
+        Args:
+            decision: The decision outcome to append
+        """
+        with open(self.config.decision_log_path, "a", encoding="utf-8") as log_file:
+            log_file.write(decision.model_dump_json() + "\n")
+    
+    def get_decision_history(self, since: Optional[str] = None, limit: Optional[int] = None) -> List[DecisionOutcome]:
         """
         Get the history of decisions made by the executive team.
         
+        Only the most recent ``max_decision_history`` decisions are kept in memory; the full
+        history is in the decision log if ``decision_log_path`` is configured.
+        
+        Args:
+            since: Optional ISO timestamp; only decisions made at or after it are returned
+            limit: Optional maximum number of (most recent) decisions to return
+            
         Returns:
-            List of decision outcomes
-        """
-        return self.decision_history
+            List of decision outcomes, oldest first
+        """
+        history = list(self.decision_history)
+        if since is not None:
+            history = [decision for decision in history if decision.timestamp >= since]
+        if limit is not None:
+            history = history[-limit:] if limit > 0 else []
+        return history
     
     def get_executive_insights(self, executive_name: str = None) -> Dict[str, Any]:
         """
@@ -645,7 +732,7 @@ class ExecutiveTeamOrchestrator:
         Returns:
             Dictionary of executive insights
         """
-        if not self.decision_history:
+        if not self._decision_count:
             return {"message": "No decision history available"}
         
         # Filter for the specific executive if provided
@@ -653,36 +740,38 @@ class ExecutiveTeamOrchestrator:
             if executive_name not in self.executives:
                 return {"error": f"Executive {executive_name} not found"}
             
-            exec_decisions = [
-                d for d in self.decision_history 
-                if executive_name in d.participating_executives
-            ]
+            stats = self._executive_stats.get(executive_name)
+            if stats is None:
+                return {
+                    "executive": executive_name,
+                    "decisions_participated": 0,
+                    "lead_decisions": 0,
+                    "avg_support_percentage": 0,
+                    "decisions": []
+                }
             
             return {
                 "executive": executive_name,
-                "decisions_participated": len(exec_decisions),
-                "lead_decisions": len([d for d in exec_decisions if d.decision_metrics.get("lead_executive") == executive_name]),
-                "avg_support_percentage": sum(d.consensus.support_percentage for d in exec_decisions) / len(exec_decisions) if exec_decisions else 0,
-                "decisions": [{"id": d.decision_id, "query": d.query, "timestamp": d.timestamp} for d in exec_decisions]
+                "decisions_participated": stats["participated"],
+                "lead_decisions": stats["lead"],
+                "avg_support_percentage": stats["support_sum"] / stats["participated"],
+                "decisions": [dict(entry) for entry in stats["decisions"]]
             }
         else:
             # Aggregate insights for all executives
             exec_insights = {}
             for name, member in self.executives.items():
-                exec_decisions = [
-                    d for d in self.decision_history 
-                    if name in d.participating_executives
-                ]
+                stats = self._executive_stats.get(name)
                 
                 exec_insights[name] = {
                     "role": member["executive"].role,
-                    "decisions_participated": len(exec_decisions),
-                    "lead_decisions": len([d for d in exec_decisions if d.decision_metrics.get("lead_executive") == name]),
-                    "avg_support_percentage": sum(d.consensus.support_percentage for d in exec_decisions) / len(exec_decisions) if exec_decisions else 0
+                    "decisions_participated": stats["participated"] if stats else 0,
+                    "lead_decisions": stats["lead"] if stats else 0,
+                    "avg_support_percentage": stats["support_sum"] / stats["participated"] if stats else 0
                 }
             
             return {
-                "total_decisions": len(self.decision_history),
+                "total_decisions": self._decision_count,
                 "executive_insights": exec_insights,
                 "framework_usage": self._calculate_framework_usage()
             }
@@ -694,13 +783,4 @@ class ExecutiveTeamOrchestrator:
         Returns:
             Dictionary mapping framework names to usage counts
         """
-        framework_counts = {}
-        
-        for decision in self.decision_history:
-            framework = decision.selected_framework
-            if framework in framework_counts:
-                framework_counts[framework] += 1
-            else:
-                framework_counts[framework] = 1
-        
-        return framework_counts
\ No newline at end of file
+        return dict(self._framework_usage)
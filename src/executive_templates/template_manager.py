@@ -6,16 +6,41 @@ executive teams based on predefined or custom templates.
 """
 
 import os
-import json
+import functools
+import importlib
 import logging
+import orjson
 from enum import Enum
-from typing import Dict, List, Any, Optional, Union, Set
-from pydantic import BaseModel, Field, validator
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Union, Set, Tuple, Type, Mapping
+from pydantic import BaseModel, Field, field_validator
 
 from src.executive_agents.base_executive import ExpertiseLevel, BaseExecutive
-from src.executive_agents.strategy_executive import StrategyExecutive
-from src.executive_agents.risk_executive import RiskExecutive
-# Import other executive types as they are implemented
+
+
+# Expertise levels by name, for resolving template level strings
+_EXPERTISE_LOOKUP: Mapping[str, ExpertiseLevel] = MappingProxyType({level.name: level for level in ExpertiseLevel})
+_VALID_LEVEL_NAMES = frozenset(_EXPERTISE_LOOKUP)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_template_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a template file's contents.
+    
+    Cached on the file's modification time and size, so repeated loads of an
+    unchanged file skip the disk read.
+    
+    Args:
+        path: Path of the template file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Raw file contents
+    """
+    with open(path, 'rb') as f:
+        return f.read()
 
 
 class DecisionStyle(str, Enum):
@@ -63,14 +88,14 @@ class ExecutiveTemplate(BaseModel):
     expertise_domains: Dict[str, str] = Field(..., description="Mapping of domains to expertise levels")
     attributes: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional executive attributes")
     
-    @validator('expertise_domains')
+    @field_validator('expertise_domains')
+    @classmethod
     def validate_expertise_levels(cls, v):
         """Validate that expertise levels are valid enum values."""
-        valid_levels = set(level.name for level in ExpertiseLevel)
         for domain, level in v.items():
-            if level not in valid_levels:
+            if level not in _VALID_LEVEL_NAMES:
                 raise ValueError(f"Invalid expertise level '{level}' for domain '{domain}'. "
-                               f"Must be one of: {', '.join(valid_levels)}")
+                               f"Must be one of: {', '.join(_EXPERTISE_LOOKUP)}")
         return v
 
 
@@ -135,12 +160,20 @@ class TemplateManager:
         self.executive_templates = self._load_executive_templates()
         self.team_templates = self._load_team_templates()
         
-        # Map role names to executive classes
-        self.role_class_map = {
-            "Chief Strategy Officer": StrategyExecutive,
-            "Chief Risk Officer": RiskExecutive,
+        # Map role names to executive classes, given as import paths until first used so
+        # listing templates doesn't import every executive implementation
+        self.role_class_map: Dict[str, Union[Type[BaseExecutive], str]] = {
+            "Chief Strategy Officer": "src.executive_agents.strategy_executive.StrategyExecutive",
+            "Chief Risk Officer": "src.executive_agents.risk_executive.RiskExecutive",
             # Add other executive classes as they are implemented
         }
+        
+        # Listings returned by get_available_templates / get_available_team_templates
+        self._available_cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._available_team_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        
+        # Template ID -> (template, executive class, expertise levels without overrides)
+        self._resolved_template_cache: Dict[str, Tuple[ExecutiveTemplate, Type[BaseExecutive], Dict[str, ExpertiseLevel]]] = {}
     
     def _load_executive_templates(self) -> TemplateCollection:
         """
@@ -154,9 +187,7 @@ class TemplateManager:
             return TemplateCollection()
         
         try:
-            with open(self.executive_templates_file, 'r') as f:
-                data = json.load(f)
-            return TemplateCollection.parse_obj(data)
+            return TemplateCollection.model_validate_json(self._read_templates_file(self.executive_templates_file))
         except Exception as e:
             self.logger.error(f"Error loading executive templates: {str(e)}")
             return TemplateCollection()
@@ -173,44 +204,91 @@ class TemplateManager:
             return TeamTemplateCollection()
         
         try:
-            with open(self.team_templates_file, 'r') as f:
-                data = json.load(f)
-            return TeamTemplateCollection.parse_obj(data)
+            return TeamTemplateCollection.model_validate_json(self._read_templates_file(self.team_templates_file))
         except Exception as e:
             self.logger.error(f"Error loading team templates: {str(e)}")
             return TeamTemplateCollection()
     
+    def _read_templates_file(self, path: str) -> bytes:
+        """
+        Read a templates file, reusing the cached contents while it is unchanged.
+        
+        Args:
+            path: Path of the templates file
+            
+        Returns:
+            Raw file contents
+        """
+        stat = os.stat(path)
+        return _read_template_file(path, stat.st_mtime_ns, stat.st_size)
+    
+    def _write_templates_file(self, path: str, collection: BaseModel) -> None:
+        """
+        Write a template collection to a templates file as indented JSON.
+        
+        The collection is written to a temporary file and synced to disk before it atomically
+        replaces the templates file, so an interrupted save never leaves a truncated file behind.
+        
+        Args:
+            path: Path of the templates file
+            collection: Template collection to write
+        """
+        payload = orjson.dumps(collection.model_dump(), option=orjson.OPT_INDENT_2)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            _read_template_file.cache_clear()
+    
     def get_available_templates(self) -> Dict[str, Dict[str, str]]:
         """
         Get a dictionary of available templates with key information.
         
+        The listing is cached until templates are saved through this manager and is
+        shared between calls, so callers should not modify it.
+        
         Returns:
             Dictionary mapping template IDs to template info (name, description, role)
         """
-        return {
-            template_id: {
-                "name": template.name,
-                "description": template.description,
-                "base_role": template.base_role
+        if self._available_cache is None:
+            self._available_cache = {
+                template_id: {
+                    "name": template.name,
+                    "description": template.description,
+                    "base_role": template.base_role
+                }
+                for template_id, template in self.executive_templates.executive_templates.items()
             }
-            for template_id, template in self.executive_templates.executive_templates.items()
-        }
+        return self._available_cache
     
     def get_available_team_templates(self) -> Dict[str, Dict[str, str]]:
         """
         Get a dictionary of available team templates with key information.
         
+        The listing is cached until templates are saved through this manager and is
+        shared between calls, so callers should not modify it.
+        
         Returns:
             Dictionary mapping team template IDs to template info (name, description)
         """
-        return {
-            template_id: {
-                "name": template.name,
-                "description": template.description,
-                "executive_count": len(template.executives)
+        if self._available_team_cache is None:
+            self._available_team_cache = {
+                template_id: {
+                    "name": template.name,
+                    "description": template.description,
+                    "executive_count": len(template.executives)
+                }
+                for template_id, template in self.team_templates.team_templates.items()
             }
-            for template_id, template in self.team_templates.team_templates.items()
-        }
+        return self._available_team_cache
     
     def get_template_details(self, template_id: str) -> Optional[ExecutiveTemplate]:
         """
@@ -224,6 +302,88 @@ class TemplateManager:
         """
         return self.executive_templates.executive_templates.get(template_id)
     
+    def _resolve_template(
+        self,
+        template_id: str
+    ) -> Optional[Tuple[ExecutiveTemplate, Type[BaseExecutive], Dict[str, ExpertiseLevel]]]:
+        """
+        Look up a template, its executive class and its expertise levels, caching the result.
+        
+        Args:
+            template_id: ID of the template to resolve
+            
+        Returns:
+            Tuple of (template, executive class, expertise levels) or None if not resolvable
+        """
+        resolved = self._resolved_template_cache.get(template_id)
+        if resolved is not None:
+            return resolved
+        
+        # Get the template
+        template = self.get_template_details(template_id)
+        if not template:
+            self.logger.error(f"Template '{template_id}' not found")
+            return None
+        
+        # Get the appropriate executive class
+        executive_class = self._get_executive_class(template.base_role)
+        if not executive_class:
+            self.logger.error(f"No implementation found for role: {template.base_role}")
+            return None
+        
+        resolved = (template, executive_class, self._resolve_expertise_domains(template))
+        self._resolved_template_cache[template_id] = resolved
+        return resolved
+    
+    def _get_executive_class(self, role: str) -> Optional[Type[BaseExecutive]]:
+        """
+        Get the executive class for a role, importing it on first use.
+        
+        Args:
+            role: Executive role title
+            
+        Returns:
+            The executive class or None if no implementation is mapped to the role
+        """
+        executive_class = self.role_class_map.get(role)
+        if isinstance(executive_class, str):
+            module_name, _, class_name = executive_class.rpartition(".")
+            executive_class = getattr(importlib.import_module(module_name), class_name)
+            self.role_class_map[role] = executive_class
+        return executive_class
+    
+    def _resolve_expertise_domains(self, template: ExecutiveTemplate) -> Dict[str, ExpertiseLevel]:
+        """
+        Convert a template's expertise level names to enum values.
+        
+        Args:
+            template: Template to take the expertise domains from
+            
+        Returns:
+            Dictionary mapping domains to expertise levels
+        """
+        return {
+            domain: self._resolve_expertise_level(domain, level_name)
+            for domain, level_name in template.expertise_domains.items()
+        }
+    
+    def _resolve_expertise_level(self, domain: str, level_name: str) -> ExpertiseLevel:
+        """
+        Convert an expertise level name to its enum value, falling back to BASIC.
+        
+        Args:
+            domain: Domain the level applies to
+            level_name: Name of the expertise level
+            
+        Returns:
+            The expertise level
+        """
+        level = _EXPERTISE_LOOKUP.get(level_name)
+        if level is None:
+            self.logger.warning(f"Invalid expertise level '{level_name}' for domain '{domain}'")
+            level = ExpertiseLevel.BASIC
+        return level
+    
     def create_executive_from_template(
         self,
         template_id: str,
@@ -247,31 +407,17 @@ class TemplateManager:
         Returns:
             Instantiated executive or None if creation failed
         """
-        # Get the template
-        template = self.get_template_details(template_id)
-        if not template:
-            self.logger.error(f"Template '{template_id}' not found")
+        resolved = self._resolve_template(template_id)
+        if resolved is None:
             return None
+        template, executive_class, expertise_domains = resolved
         
-        # Get the appropriate executive class
-        executive_class = self.role_class_map.get(template.base_role)
-        if not executive_class:
-            self.logger.error(f"No implementation found for role: {template.base_role}")
-            return None
-        
-        # Prepare expertise domains dictionary
-        expertise_domains = {}
-        for domain, level_name in template.expertise_domains.items():
-            try:
-                # Override expertise level if specified
-                if expertise_overrides and domain in expertise_overrides:
-                    level_name = expertise_overrides[domain]
-                
-                # Convert string level name to enum value
-                expertise_domains[domain] = ExpertiseLevel[level_name]
-            except KeyError:
-                self.logger.warning(f"Invalid expertise level '{level_name}' for domain '{domain}'")
-                expertise_domains[domain] = ExpertiseLevel.BASIC
+        # Prepare expertise domains dictionary, overriding levels of the template's domains
+        expertise_domains = dict(expertise_domains)
+        if expertise_overrides:
+            for domain, level_name in expertise_overrides.items():
+                if domain in expertise_domains:
+                    expertise_domains[domain] = self._resolve_expertise_level(domain, level_name)
         
         # Create the executive instance
         name = custom_name or template.name
@@ -286,16 +432,13 @@ class TemplateManager:
             executive.expertise_domains = expertise_domains
             
             # Apply custom attributes if the executive class supports them
-            if hasattr(executive, 'attributes') and template.attributes:
-                # Start with template attributes
-                attributes = template.attributes.copy()
-                
-                # Apply any overrides
+            if template.attributes and hasattr(executive, 'attributes'):
+                # Template attributes with any overrides applied, merged in one pass; the
+                # executive always gets its own dict so the template isn't shared
                 if attribute_overrides:
-                    attributes.update(attribute_overrides)
-                
-                # Set attributes on the executive
-                executive.attributes = attributes
+                    executive.attributes = {**template.attributes, **attribute_overrides}
+                else:
+                    executive.attributes = template.attributes.copy()
                 
             return executive
         except Exception as e:
@@ -358,10 +501,11 @@ class TemplateManager:
         try:
             # Add to templates
             self.executive_templates.executive_templates[template.template_id] = template
+            self._resolved_template_cache.pop(template.template_id, None)
+            self._available_cache = None
             
             # Save to file
-            with open(self.executive_templates_file, 'w') as f:
-                json.dump(self.executive_templates.dict(), f, indent=2)
+            self._write_templates_file(self.executive_templates_file, self.executive_templates)
             
             return True
         except Exception as e:
@@ -381,22 +525,32 @@ class TemplateManager:
         try:
             # Add to team templates
             self.team_templates.team_templates[team_template.template_id] = team_template
+            self._available_team_cache = None
             
             # Save to file
-            with open(self.team_templates_file, 'w') as f:
-                json.dump(self.team_templates.dict(), f, indent=2)
+            self._write_templates_file(self.team_templates_file, self.team_templates)
             
             return True
         except Exception as e:
             self.logger.error(f"Error saving team template: {str(e)}")
             return False
     
-    def create_default_templates(self) -> None:
-        """Create and save default templates if none exist."""
-        # Check if we already have templates
-        if self.executive_templates.executive_templates:
-            return
+    def create_default_templates(self, persist: bool = True) -> None:
+        """
+        Create and save default templates for collections that have none.
         
+        Args:
+            persist: Whether to write the default templates to the templates files; when
+                False they are only added to this manager and saved with the collection
+                by the next save_custom_template or save_team_template
+        """
+        if not self.executive_templates.executive_templates:
+            self._create_default_executive_templates(persist)
+        if not self.team_templates.team_templates:
+            self._create_default_team_templates(persist)
+    
+    def _create_default_executive_templates(self, persist: bool) -> None:
+        """Add the default executive templates, saving them if persist is set."""
         # Create default templates
         default_templates = {
             "visionary_strategist": ExecutiveTemplate(
@@ -442,11 +596,17 @@ class TemplateManager:
         # Add to templates
         for template_id, template in default_templates.items():
             self.executive_templates.executive_templates[template_id] = template
+            self._resolved_template_cache.pop(template_id, None)
+        self._available_cache = None
         
         # Save to file
-        with open(self.executive_templates_file, 'w') as f:
-            json.dump(self.executive_templates.dict(), f, indent=2)
+        if persist:
+            self._write_templates_file(self.executive_templates_file, self.executive_templates)
         
+        self.logger.info("Created default executive templates")
+    
+    def _create_default_team_templates(self, persist: bool) -> None:
+        """Add the default team template, saving it if persist is set."""
         # Create a default team template
         balanced_team = ExecutiveTeamTemplate(
             template_id="balanced_executive_team",
@@ -456,9 +616,10 @@ class TemplateManager:
         )
         
         self.team_templates.team_templates["balanced_executive_team"] = balanced_team
+        self._available_team_cache = None
         
         # Save to file
-        with open(self.team_templates_file, 'w') as f:
-            json.dump(self.team_templates.dict(), f, indent=2)
+        if persist:
+            self._write_templates_file(self.team_templates_file, self.team_templates)
         
-        self.logger.info("Created default executive and team templates")
\ No newline at end of file
+        self.logger.info("Created default team templates")
\ No newline at end of file
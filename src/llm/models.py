@@ -109,9 +109,12 @@ AVAILABLE_MODELS = [
 # Create LLM_ORDER in the format expected by the UI
 LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 
+# Index for get_model_info; reversed so the first entry wins if a model_name is listed twice
+_MODELS_BY_NAME = {model.model_name: model for model in reversed(AVAILABLE_MODELS)}
+
 def get_model_info(model_name: str) -> LLMModel | None:
     """Get model information by model_name"""
-    return next((model for model in AVAILABLE_MODELS if model.model_name == model_name), None)
+    return _MODELS_BY_NAME.get(model_name)
 
 def get_model(model_name: str, model_provider: ModelProvider) -> ChatOpenAI | ChatGroq | None:
     if model_provider == ModelProvider.GROQ:
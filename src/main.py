@@ -9,38 +9,13 @@ the executive team simulation.
 
 import sys
 import asyncio
+import functools
 import argparse
 import logging
-import json
+import orjson
 from datetime import datetime
-from pprint import pprint
-from dotenv import load_dotenv
 from colorama import Fore, Style, init
-import questionary
-
-# Import executive agents
-from src.executive_agents.base_executive import ExecutiveContext, ExpertiseLevel
-from src.executive_agents.strategy_executive import StrategyExecutive
-from src.executive_agents.risk_executive import RiskExecutive
-
-# Import decision frameworks
-from src.decision_frameworks.base_framework import DecisionContext, ComplexityLevel
-from src.decision_frameworks.bayesian_framework import BayesianDecisionFramework
-
-# Import consensus building
-from src.consensus.consensus_builder import ConsensusBuilder
-
-# Import orchestrator
-from src.executive_team_orchestrator import ExecutiveTeamOrchestrator, ExecutiveTeamConfig
-
-# Import LLM models
-from src.llm.models import LLM_ORDER, get_model_info
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Initialize colorama
-init(autoreset=True)
+from dotenv import load_dotenv
 
 # Set up logging
 logging.basicConfig(
@@ -56,20 +31,33 @@ EXECUTIVE_OPTIONS = [
     # Add more executives as they are implemented
 ]
 
-async def run_decision_process(decision_request, model_name, model_provider, selected_executives):
+# Static sections of the decision report, formatted once
+_RULE = "=" * 80
+_HEADER_SUMMARY = f"\n{_RULE}\n{Fore.CYAN}DECISION OUTCOME SUMMARY{Style.RESET_ALL}\n{_RULE}\n"
+_HEADER_RECOMMENDATION = f"\n{Fore.GREEN}RECOMMENDATION:{Style.RESET_ALL}\n"
+_HEADER_CONSENSUS = f"\n{Fore.YELLOW}CONSENSUS INFORMATION:{Style.RESET_ALL}\n"
+_HEADER_PARTICIPANTS = f"\n{Fore.MAGENTA}PARTICIPATING EXECUTIVES:{Style.RESET_ALL}\n"
+_HEADER_DETAILS = f"\n{Fore.CYAN}DETAILED RECOMMENDATION:{Style.RESET_ALL}\n{'-' * 80}\n"
+_HEADER_RISKS = f"\n{Fore.RED}RISKS:{Style.RESET_ALL}\n"
+_HEADER_ALTERNATIVES = f"\n{Fore.YELLOW}ALTERNATIVES CONSIDERED:{Style.RESET_ALL}\n"
+
+@functools.lru_cache(maxsize=8)
+def _get_orchestrator(model_name, model_provider, selected_executives):
     """
-    Run the full decision-making process with the executive team.
+    Get the orchestrator wired with the selected executives, reusing it across decisions.
     
     Args:
-        decision_request: The decision request details
         model_name: The LLM model to use
         model_provider: The LLM provider
-        selected_executives: List of selected executive types
+        selected_executives: Frozen set of selected executive types
         
     Returns:
-        The decision outcome
+        The configured executive team orchestrator
     """
-    logger.info(f"Starting decision process for: {decision_request['query']}")
+    # Imported here so only the selected executives' modules are loaded
+    from src.executive_team_orchestrator import ExecutiveTeamOrchestrator, ExecutiveTeamConfig
+    from src.decision_frameworks.bayesian_framework import BayesianDecisionFramework
+    from src.consensus.consensus_builder import ConsensusBuilder
     
     # Create orchestrator with configuration
     config = ExecutiveTeamConfig(
@@ -83,6 +71,8 @@ async def run_decision_process(decision_request, model_name, model_provider, sel
     
     # Create and register executives
     if "strategy" in selected_executives:
+        from src.executive_agents.strategy_executive import StrategyExecutive
+        
         strategy_exec = StrategyExecutive(
             name="Strategy Executive",
             model_provider=model_provider,
@@ -95,6 +85,8 @@ async def run_decision_process(decision_request, model_name, model_provider, sel
         )
     
     if "risk" in selected_executives:
+        from src.executive_agents.risk_executive import RiskExecutive
+        
         risk_exec = RiskExecutive(
             name="Risk Management Executive",
             model_provider=model_provider,
@@ -110,77 +102,146 @@ async def run_decision_process(decision_request, model_name, model_provider, sel
     bayesian_framework = BayesianDecisionFramework()
     orchestrator.register_framework(bayesian_framework)
     
-    # Create consensus builder
-    consensus_builder = ConsensusBuilder()
-    orchestrator.set_consensus_builder(consensus_builder)
+    # Create consensus builder with the team's thresholds
+    orchestrator.consensus_builder = ConsensusBuilder(
+        consensus_threshold=config.consensus_threshold,
+        min_participation=config.min_executive_participation
+    )
+    
+    return orchestrator
+
+async def run_decision_process(decision_request, model_name, model_provider, selected_executives):
+    """
+    Run the full decision-making process with the executive team.
+    
+    The orchestrator for a given model and executive selection is built once and reused
+    by later decisions in the same process.
+    
+    Args:
+        decision_request: The decision request details
+        model_name: The LLM model to use
+        model_provider: The LLM provider
+        selected_executives: List of selected executive types
+        
+    Returns:
+        The decision outcome
+    """
+    from src.executive_team_orchestrator import DecisionRequest
+    
+    logger.info("Starting decision process for: %s", decision_request['query'])
+    
+    orchestrator = _get_orchestrator(model_name, model_provider, frozenset(selected_executives))
     
     # Make the decision
-    decision_outcome = await orchestrator.make_decision(decision_request)
+    decision_outcome = await orchestrator.make_decision(DecisionRequest(**decision_request))
     
     return decision_outcome
 
+async def stream_decision_batch(decision_requests, model_name, model_provider, selected_executives, concurrency=8):
+    """
+    Run several decisions concurrently, yielding each outcome as soon as it is ready.
+    
+    Args:
+        decision_requests: List of decision request details
+        model_name: The LLM model to use
+        model_provider: The LLM provider
+        selected_executives: List of selected executive types
+        concurrency: Maximum number of decisions in flight at once
+        
+    Yields:
+        Decision outcomes, in completion order
+    """
+    logger.info("Starting batch decision process for %d requests", len(decision_requests))
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(decision_request):
+        async with semaphore:
+            return await run_decision_process(decision_request, model_name, model_provider, selected_executives)
+    
+    # Schedule in request order so earlier requests take the first semaphore slots
+    tasks = [asyncio.ensure_future(run_one(decision_request)) for decision_request in decision_requests]
+    for next_outcome in asyncio.as_completed(tasks):
+        yield await next_outcome
+
 def print_decision_output(decision_outcome):
     """
     Print the decision outcome in a formatted way.
     
+    The report is assembled in memory and written to stdout in one call.
+    
     Args:
         decision_outcome: The decision outcome from the executive team
     """
-    print("\n" + "="*80)
-    print(f"{Fore.CYAN}DECISION OUTCOME SUMMARY{Style.RESET_ALL}")
-    print("="*80)
-    print(f"Decision ID: {decision_outcome['decision_id']}")
-    print(f"Query: {decision_outcome['query']}")
-    
-    print(f"\n{Fore.GREEN}RECOMMENDATION:{Style.RESET_ALL}")
-    print(f"Title: {decision_outcome['recommendation'].title}")
-    print(f"Summary: {decision_outcome['recommendation'].summary}")
-    print(f"Confidence: {decision_outcome['recommendation'].confidence.name}")
-    
-    print(f"\n{Fore.YELLOW}CONSENSUS INFORMATION:{Style.RESET_ALL}")
-    print(f"Consensus Level: {decision_outcome['consensus'].consensus_level}")
-    print(f"Support Percentage: {decision_outcome['consensus'].support_percentage:.1%}")
-    
-    print("\nExecutive Agreement:")
-    for exec_name, agreement in decision_outcome['consensus'].executive_agreement.items():
-        print(f"  - {exec_name}: {agreement:.1%}")
-    
-    if decision_outcome['consensus'].key_conflicts:
-        print("\nKey Conflicts:")
-        for conflict in decision_outcome['consensus'].key_conflicts:
-            print(f"  - {conflict}")
-    
-    print(f"\n{Fore.MAGENTA}PARTICIPATING EXECUTIVES:{Style.RESET_ALL}")
-    for exec_name in decision_outcome['participating_executives']:
-        print(f"  - {exec_name}")
-    
-    print(f"\nSELECTED FRAMEWORK: {decision_outcome['selected_framework']}")
-    print(f"RESOLUTION ATTEMPTS: {decision_outcome['resolution_attempts']}")
-    
-    print(f"\n{Fore.CYAN}DETAILED RECOMMENDATION:{Style.RESET_ALL}")
-    print("-"*80)
-    print(decision_outcome['recommendation'].detailed_description)
-    
-    print(f"\n{Fore.RED}RISKS:{Style.RESET_ALL}")
-    if decision_outcome['recommendation'].risks:
-        for risk in decision_outcome['recommendation'].risks:
-            print(f"  - {risk.risk_category}: {risk.risk_description}")
-            print(f"    Impact: {risk.impact.name}, Likelihood: {risk.likelihood.name}")
-            print(f"    Mitigations: {', '.join(risk.mitigation_strategies[:2])}")
-            print()
+    recommendation = decision_outcome.recommendation
+    consensus = decision_outcome.consensus
+    
+    parts = [
+        _HEADER_SUMMARY,
+        f"Decision ID: {decision_outcome.decision_id}\n",
+        f"Query: {decision_outcome.query}\n",
+        _HEADER_RECOMMENDATION,
+        f"Title: {recommendation.title}\n",
+        f"Summary: {recommendation.summary}\n",
+        f"Confidence: {recommendation.confidence.name}\n",
+        _HEADER_CONSENSUS,
+        f"Consensus Level: {consensus.consensus_level.value}\n",
+        f"Support Percentage: {consensus.support_percentage:.1%}\n",
+    ]
+    
+    positions = [
+        f"  - {exec_name}: {position}\n"
+        for position, exec_names in (
+            ("supporting", consensus.supporting_executives),
+            ("opposing", consensus.opposing_executives),
+            ("abstaining", consensus.abstaining_executives)
+        )
+        for exec_name in exec_names
+    ]
+    if positions:
+        parts.append("\nExecutive Positions:\n")
+        parts.extend(positions)
+    
+    if consensus.key_conflicts:
+        parts.append("\nKey Conflicts:\n")
+        parts.extend(
+            f"  - {conflict.get('description', conflict)}\n" for conflict in consensus.key_conflicts
+        )
+    
+    parts.append(_HEADER_PARTICIPANTS)
+    parts.extend(f"  - {exec_name}\n" for exec_name in decision_outcome.participating_executives)
+    
+    parts.append(f"\nSELECTED FRAMEWORK: {decision_outcome.selected_framework}\n")
+    parts.append(f"RESOLUTION ATTEMPTS: {decision_outcome.resolution_attempts}\n")
+    
+    parts.append(_HEADER_DETAILS)
+    parts.append(f"{recommendation.detailed_description}\n")
+    
+    parts.append(_HEADER_RISKS)
+    if recommendation.risks:
+        parts.extend(
+            f"  - {risk.risk_category}: {risk.risk_description}\n"
+            f"    Impact: {risk.impact.name}, Likelihood: {risk.likelihood.name}\n"
+            f"    Mitigations: {', '.join(risk.mitigation_strategies[:2])}\n"
+            "\n"
+            for risk in recommendation.risks
+        )
     else:
-        print("  No specific risks identified")
-    
-    print(f"\n{Fore.YELLOW}ALTERNATIVES CONSIDERED:{Style.RESET_ALL}")
-    if decision_outcome['recommendation'].alternatives_considered:
-        for alt in decision_outcome['recommendation'].alternatives_considered:
-            print(f"  - {alt.title}: {alt.description}")
-            print(f"    Why not selected: {alt.why_not_selected}")
-            print()
+        parts.append("  No specific risks identified\n")
+    
+    parts.append(_HEADER_ALTERNATIVES)
+    if recommendation.alternatives_considered:
+        parts.extend(
+            f"  - {alt.title}: {alt.description}\n"
+            f"    Why not selected: {alt.why_not_selected}\n"
+            "\n"
+            for alt in recommendation.alternatives_considered
+        )
     else:
-        print("  No alternatives specified")
+        parts.append("  No alternatives specified\n")
     
-    print("="*80)
+    parts.append(_RULE + "\n")
+    sys.stdout.write("".join(parts))
 
 async def main():
     """
@@ -225,16 +286,47 @@ async def main():
         action="store_true",
         help="Show detailed reasoning from each executive"
     )
+    parser.add_argument(
+        "--executives",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        help="Comma-separated executives to include (e.g. strategy,risk); prompted for if omitted"
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        help="LLM model name to use; prompted for if omitted"
+    )
     
     args = parser.parse_args()
     
+    if args.executives is not None:
+        valid_executives = [value for _, value in EXECUTIVE_OPTIONS]
+        unknown_executives = [name for name in args.executives if name not in valid_executives]
+        if unknown_executives or not args.executives:
+            parser.error(
+                f"--executives must list one or more of: {', '.join(valid_executives)}"
+            )
+    
+    # Load environment variables from .env file
+    load_dotenv()
+    
+    # Initialize colorama
+    init(autoreset=True)
+    
+    # Deferred until after argument parsing so --help skips the prompt and LLM SDK libraries
+    import questionary
+    from src.llm.models import LLM_ORDER, get_model_info
+    
     # Determine how to get the decision request
     if args.input_file:
         # Load from file
         try:
-            with open(args.input_file, 'r') as f:
-                decision_request = json.load(f)
-            print(f"Loaded decision request from {args.input_file}")
+            with open(args.input_file, 'rb') as f:
+                decision_request = orjson.loads(f.read())
+            if isinstance(decision_request, list):
+                print(f"Loaded {len(decision_request)} decision requests from {args.input_file}")
+            else:
+                print(f"Loaded decision request from {args.input_file}")
         except Exception as e:
             print(f"Error loading decision request from file: {e}")
             sys.exit(1)
@@ -319,20 +411,23 @@ async def main():
         sys.exit(1)
     
     # Select executives
-    selected_executives = questionary.checkbox(
-        "Select executives to include in the decision process:",
-        choices=[questionary.Choice(display, value=value) for display, value in EXECUTIVE_OPTIONS],
-        instruction="\n\nInstructions: \n1. Press Space to select/unselect executives.\n2. Press 'a' to select/unselect all.\n3. Press Enter when done.\n",
-        validate=lambda x: len(x) > 0 or "You must select at least one executive.",
-        style=questionary.Style(
-            [
-                ("checkbox-selected", "fg:green"),
-                ("selected", "fg:green noinherit"),
-                ("highlighted", "noinherit"),
-                ("pointer", "noinherit"),
-            ]
-        ),
-    ).ask()
+    if args.executives:
+        selected_executives = args.executives
+    else:
+        selected_executives = questionary.checkbox(
+            "Select executives to include in the decision process:",
+            choices=[questionary.Choice(display, value=value) for display, value in EXECUTIVE_OPTIONS],
+            instruction="\n\nInstructions: \n1. Press Space to select/unselect executives.\n2. Press 'a' to select/unselect all.\n3. Press Enter when done.\n",
+            validate=lambda x: len(x) > 0 or "You must select at least one executive.",
+            style=questionary.Style(
+                [
+                    ("checkbox-selected", "fg:green"),
+                    ("selected", "fg:green noinherit"),
+                    ("highlighted", "noinherit"),
+                    ("pointer", "noinherit"),
+                ]
+            ),
+        ).ask()
     
     if not selected_executives:
         print("\n\nInterrupt received. Exiting...")
@@ -341,16 +436,19 @@ async def main():
     print(f"\nSelected executives: {', '.join(Fore.GREEN + choice.title().replace('_', ' ') + Style.RESET_ALL for choice in selected_executives)}\n")
     
     # Select LLM model
-    model_choice = questionary.select(
-        "Select your LLM model:",
-        choices=[questionary.Choice(display, value=value) for display, value, _ in LLM_ORDER],
-        style=questionary.Style([
-            ("selected", "fg:green bold"),
-            ("pointer", "fg:green bold"),
-            ("highlighted", "fg:green"),
-            ("answer", "fg:green bold"),
-        ])
-    ).ask()
+    if args.model:
+        model_choice = args.model
+    else:
+        model_choice = questionary.select(
+            "Select your LLM model:",
+            choices=[questionary.Choice(display, value=value) for display, value, _ in LLM_ORDER],
+            style=questionary.Style([
+                ("selected", "fg:green bold"),
+                ("pointer", "fg:green bold"),
+                ("highlighted", "fg:green"),
+                ("answer", "fg:green bold"),
+            ])
+        ).ask()
     
     if not model_choice:
         print("\n\nInterrupt received. Exiting...")
@@ -365,6 +463,24 @@ async def main():
         model_provider = "Unknown"
         print(f"\nSelected model: {Fore.GREEN + Style.BRIGHT}{model_choice}{Style.RESET_ALL}\n")
     
+    # Run a batch of decisions from a list-shaped input file
+    if isinstance(decision_request, list):
+        print(f"Making {len(decision_request)} decisions")
+        try:
+            # Print each outcome as it completes rather than after the whole batch
+            async for decision_outcome in stream_decision_batch(
+                decision_requests=decision_request,
+                model_name=model_choice,
+                model_provider=model_provider,
+                selected_executives=selected_executives
+            ):
+                print_decision_output(decision_outcome)
+        except Exception as e:
+            logger.error("Error during decision process: %s", e)
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+        return
+    
     # Run the decision process
     print(f"Making decision on: {decision_request['query']}")
     try:
@@ -385,34 +501,34 @@ async def main():
         ).ask()
         
         if save_results:
-            filename = f"decision_{decision_request['decision_id']}.json"
-            with open(filename, 'w') as f:
+            filename = f"decision_{decision_outcome.decision_id}.json"
+            with open(filename, 'wb') as f:
                 # Convert to JSON-serializable format
                 result_dict = {
-                    "decision_id": decision_outcome["decision_id"],
-                    "query": decision_outcome["query"],
-                    "participating_executives": decision_outcome["participating_executives"],
-                    "selected_framework": decision_outcome["selected_framework"],
-                    "resolution_attempts": decision_outcome["resolution_attempts"],
-                    "recommendation": {
-                        "title": decision_outcome["recommendation"].title,
-                        "summary": decision_outcome["recommendation"].summary,
-                        "confidence": decision_outcome["recommendation"].confidence.name,
-                        "detailed_description": decision_outcome["recommendation"].detailed_description,
-                    },
-                    "consensus": {
-                        "level": decision_outcome["consensus"].consensus_level.value,
-                        "support_percentage": decision_outcome["consensus"].support_percentage,
-                    },
+                    "decision_id": decision_outcome.decision_id,
+                    "query": decision_outcome.query,
+                    "participating_executives": decision_outcome.participating_executives,
+                    "selected_framework": decision_outcome.selected_framework,
+                    "resolution_attempts": decision_outcome.resolution_attempts,
+                    "recommendation": decision_outcome.recommendation.model_dump(mode="json"),
+                    # The consensus carries its own copy of the recommendation; save it only once
+                    "consensus": decision_outcome.consensus.model_dump(
+                        mode="json", exclude={"recommendation"}
+                    ),
                     "timestamp": datetime.now().isoformat()
                 }
-                json.dump(result_dict, f, indent=2)
+                f.write(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
             print(f"Results saved to {filename}")
         
     except Exception as e:
-        logger.error(f"Error during decision process: {str(e)}")
+        logger.error("Error during decision process: %s", e)
         print(f"Error: {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop is optional; the default asyncio event loop is used instead
+        pass
     asyncio.run(main())
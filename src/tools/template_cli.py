@@ -7,12 +7,8 @@ Command-line interface for managing and using executive templates.
 
 import os
 import sys
-import json
 import argparse
-import asyncio
-from pprint import pprint
-from tabulate import tabulate
-import questionary
+from types import MappingProxyType
 from colorama import Fore, Style, init as colorama_init
 
 # Add parent directory to path to allow imports
@@ -20,22 +16,21 @@ script_dir = os.path.dirname(os.path.realpath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(script_dir))
 sys.path.append(parent_dir)
 
-from src.executive_templates import (
-    TemplateManager, 
-    ExecutiveTemplate,
-    ExecutiveTeamTemplate,
-    DecisionStyle,
-    RiskTolerance,
-    TimeOrientation
-)
-from src.executive_team_orchestrator import ExecutiveTeamOrchestrator, ExecutiveTeamConfig
+# Heavier dependencies (templates, orchestrator, tabulate, questionary) are imported by the
+# commands that use them, so --help and simple commands don't load the whole stack
 
-# Initialize colorama
-colorama_init(autoreset=True)
+# Orchestrator registration per role keyword, checked in order against executive.role:
+# (keyword, role priorities, veto domains). Add more roles as needed.
+_ROLE_REGISTRATIONS = (
+    ("Strategy", MappingProxyType({"strategic": 5, "market": 4, "innovation": 4, "financial": 3}), ("strategic",)),
+    ("Risk", MappingProxyType({"risk": 5, "compliance": 5, "financial": 3, "operational": 4}), ("risk", "compliance")),
+)
 
 
 def display_available_templates(template_manager):
     """Display a table of available executive templates."""
+    from tabulate import tabulate
+    
     templates = template_manager.get_available_templates()
     
     if not templates:
@@ -59,6 +54,8 @@ def display_available_templates(template_manager):
 
 def display_available_team_templates(template_manager):
     """Display a table of available team templates."""
+    from tabulate import tabulate
+    
     templates = template_manager.get_available_team_templates()
     
     if not templates:
@@ -107,6 +104,8 @@ def display_template_details(template_manager, template_id):
 
 def create_executive_interactive(template_manager):
     """Interactive workflow to create an executive from a template."""
+    import questionary
+    
     # Get available templates
     templates = template_manager.get_available_templates()
     if not templates:
@@ -115,15 +114,14 @@ def create_executive_interactive(template_manager):
     
     # Ask user to select a template
     template_choices = [
-        f"{info['name']} ({info['base_role']})" 
+        questionary.Choice(title=f"{info['name']} ({info['base_role']})", value=template_id)
         for template_id, info in templates.items()
     ]
-    template_ids = list(templates.keys())
     
     questions = [
         {
             "type": "select",
-            "name": "template_index",
+            "name": "template_id",
             "message": "Select a template to use:",
             "choices": template_choices
         },
@@ -138,7 +136,7 @@ def create_executive_interactive(template_manager):
     if not answers:
         return None
     
-    template_id = template_ids[answers["template_index"]]
+    template_id = answers["template_id"]
     custom_name = answers["custom_name"] if answers["custom_name"] else None
     
     # Ask for model information
@@ -179,6 +177,9 @@ def create_executive_interactive(template_manager):
 
 def create_custom_template_interactive(template_manager):
     """Interactive workflow to create a custom executive template."""
+    import questionary
+    from src.executive_templates import ExecutiveTemplate, DecisionStyle, RiskTolerance, TimeOrientation
+    
     # Get base roles
     base_roles = ["Chief Strategy Officer", "Chief Risk Officer"]
     
@@ -251,40 +252,22 @@ def create_custom_template_interactive(template_manager):
         return
     
     # Ask for attributes
-    attributes = {}
-    
     print(f"\n{Fore.CYAN}Add attributes (optional){Style.RESET_ALL}")
     
-    # Decision style
-    decision_style_question = [
+    # The attribute questions are independent, so they are asked in one prompt
+    attribute_questions = [
         {
             "type": "select",
             "name": "decision_style",
             "message": "Decision style:",
             "choices": [s.value for s in DecisionStyle]
-        }
-    ]
-    
-    decision_style_answer = questionary.prompt(decision_style_question)
-    if decision_style_answer:
-        attributes["decision_style"] = decision_style_answer["decision_style"].upper()
-    
-    # Risk tolerance
-    risk_tolerance_question = [
+        },
         {
             "type": "select",
             "name": "risk_tolerance",
             "message": "Risk tolerance:",
             "choices": [r.value for r in RiskTolerance]
-        }
-    ]
-    
-    risk_tolerance_answer = questionary.prompt(risk_tolerance_question)
-    if risk_tolerance_answer:
-        attributes["risk_tolerance"] = risk_tolerance_answer["risk_tolerance"].upper()
-    
-    # Time orientation
-    time_orientation_question = [
+        },
         {
             "type": "select",
             "name": "time_orientation",
@@ -293,9 +276,8 @@ def create_custom_template_interactive(template_manager):
         }
     ]
     
-    time_orientation_answer = questionary.prompt(time_orientation_question)
-    if time_orientation_answer:
-        attributes["time_orientation"] = time_orientation_answer["time_orientation"].upper()
+    attribute_answers = questionary.prompt(attribute_questions)
+    attributes = {name: value.upper() for name, value in attribute_answers.items()}
     
     # Create the template
     template = ExecutiveTemplate(
@@ -316,6 +298,9 @@ def create_custom_template_interactive(template_manager):
 
 def create_team_template_interactive(template_manager):
     """Interactive workflow to create a team template."""
+    import questionary
+    from src.executive_templates import ExecutiveTeamTemplate
+    
     # Get available executive templates
     templates = template_manager.get_available_templates()
     if not templates:
@@ -384,6 +369,9 @@ def create_team_template_interactive(template_manager):
 
 async def run_decision_with_team_template(template_manager):
     """Interactive workflow to run a decision with a team template."""
+    import questionary
+    from src.executive_team_orchestrator import ExecutiveTeamOrchestrator, ExecutiveTeamConfig
+    
     # Get available team templates
     team_templates = template_manager.get_available_team_templates()
     if not team_templates:
@@ -392,14 +380,13 @@ async def run_decision_with_team_template(template_manager):
     
     # Ask user to select a team template
     team_template_choices = [
-        f"{info['name']} ({info['executive_count']} executives)" 
+        questionary.Choice(title=f"{info['name']} ({info['executive_count']} executives)", value=template_id)
         for template_id, info in team_templates.items()
     ]
-    team_template_ids = list(team_templates.keys())
     
     team_question = {
         "type": "select",
-        "name": "team_template_index",
+        "name": "team_template_id",
         "message": "Select a team template to use:",
         "choices": team_template_choices
     }
@@ -408,7 +395,7 @@ async def run_decision_with_team_template(template_manager):
     if not team_answer:
         return
     
-    team_template_id = team_template_ids[team_answer["team_template_index"]]
+    team_template_id = team_answer["team_template_id"]
     
     # Ask for model information
     model_questions = [
@@ -559,19 +546,14 @@ async def run_decision_with_team_template(template_manager):
     
     # Register executives with the orchestrator
     for executive in executives:
-        if "Strategy" in executive.role:
-            orchestrator.register_executive(
-                executive=executive,
-                role_priority={"strategic": 5, "market": 4, "innovation": 4, "financial": 3},
-                veto_rights=["strategic"]
-            )
-        elif "Risk" in executive.role:
-            orchestrator.register_executive(
-                executive=executive,
-                role_priority={"risk": 5, "compliance": 5, "financial": 3, "operational": 4},
-                veto_rights=["risk", "compliance"]
-            )
-        # Add more role checks as needed
+        for role_keyword, role_priority, veto_rights in _ROLE_REGISTRATIONS:
+            if role_keyword in executive.role:
+                orchestrator.register_executive(
+                    executive=executive,
+                    role_priority=dict(role_priority),
+                    veto_rights=list(veto_rights)
+                )
+                break
     
     # For demonstration purposes, we'll just show the setup
     # In a real implementation, you would register frameworks and make the decision
@@ -613,14 +595,24 @@ def main():
     # Run decision with team template command
     run_parser = subparsers.add_parser("run", help="Run a decision with a team template")
     
+    # Parse arguments
+    args = parser.parse_args()
+    
+    if args.command is None:
+        # Display help if no command provided
+        parser.print_help()
+        return
+    
+    # Initialize colorama
+    colorama_init(autoreset=True)
+    
+    from src.executive_templates import TemplateManager
+    
     # Initialize template manager
     template_manager = TemplateManager()
     
-    # Create default templates if needed
-    template_manager.create_default_templates()
-    
-    # Parse arguments
-    args = parser.parse_args()
+    # Add the default templates if needed; they are written out with the first saved template
+    template_manager.create_default_templates(persist=False)
     
     # Execute command
     if args.command == "list":
@@ -642,11 +634,9 @@ def main():
         create_team_template_interactive(template_manager)
     
     elif args.command == "run":
+        import asyncio
+        
         asyncio.run(run_decision_with_team_template(template_manager))
-    
-    else:
-        # Display help if no command provided
-        parser.print_help()
 
 
 if __name__ == "__main__":